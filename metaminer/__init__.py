@@ -1,7 +1,7 @@
 from .inquiry import Inquiry
 from .extractor import extract_metadata
 from .document_reader import extract_text, extract_text_from_directory, get_supported_extensions
-from .question_parser import parse_questions_from_file
+from .question_parser import parse_questions_from_file, parse_questions_as_columns, parse_question_records, Question
 from .schema_builder import build_schema_from_questions
 from .config import Config, setup_logging
 from .datatype_inferrer import DataTypeInferrer, TypeSuggestion, infer_question_types
@@ -15,6 +15,9 @@ __all__ = [
     "extract_text_from_directory",
     "get_supported_extensions",
     "parse_questions_from_file",
+    "parse_questions_as_columns",
+    "parse_question_records",
+    "Question",
     "build_schema_from_questions",
     "Config",
     "setup_logging",
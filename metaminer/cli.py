@@ -61,6 +61,11 @@ Examples:
         help="OpenAI API key (can also be set via OPENAI_API_KEY environment variable)"
     )
     
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for caching API responses between runs (requires diskcache)"
+    )
+    
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -92,6 +97,8 @@ Examples:
             base_url=args.base_url,
             api_key=args.api_key
         )
+        if args.cache_dir:
+            config.cache_dir = args.cache_dir
         
         # Create Inquiry instance
         if args.verbose:
@@ -2,11 +2,20 @@
 Configuration management for metaminer using pydantic-settings.
 """
 import logging
+import os
+import stat
 from typing import Optional, List
 from pathlib import Path
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 
+from .question_parser import _is_valid_array_type, _is_valid_enum_type
+
+# Basic question types (case-insensitive); also listed in validation error messages
+_VALID_TYPES = ["str", "string", "text", "int", "integer", "number",
+                "float", "decimal", "bool", "boolean", "date", "datetime"]
+_VALID_TYPE_SET = frozenset(_VALID_TYPES)
+
 
 class Config(BaseSettings):
     """Configuration class for metaminer settings using pydantic-settings."""
@@ -17,6 +26,7 @@ class Config(BaseSettings):
     model: str = Field(default="gpt-3.5-turbo", alias="METAMINER_MODEL")
     timeout: float = Field(default=30.0, alias="METAMINER_TIMEOUT", gt=0)
     max_retries: int = Field(default=3, alias="METAMINER_MAX_RETRIES", ge=0)
+    use_tool_calling: bool = Field(default=False, alias="METAMINER_USE_TOOL_CALLING")
     
     # Logging Configuration
     log_level: str = Field(default="INFO", alias="METAMINER_LOG_LEVEL")
@@ -24,6 +34,7 @@ class Config(BaseSettings):
     
     # File Processing Configuration
     max_file_size_mb: int = Field(default=50, gt=0)
+    csv_delimiter: Optional[str] = Field(default=None, alias="METAMINER_CSV_DELIMITER")
     supported_extensions: List[str] = Field(default_factory=lambda: [
         '.pdf', '.docx', '.doc', '.odt', '.rtf', '.txt', '.md', '.html', '.epub', '.tex'
     ])
@@ -34,6 +45,10 @@ class Config(BaseSettings):
     batch_size: int = Field(default=100, alias="METAMINER_BATCH_SIZE", gt=0)
     enable_progress_bar: bool = Field(default=True, alias="METAMINER_ENABLE_PROGRESS_BAR")
     
+    # Cache Configuration
+    cache_dir: Optional[str] = Field(default=None, alias="METAMINER_CACHE_DIR")
+    cache_size: int = Field(default=0, alias="METAMINER_CACHE_SIZE", ge=0)
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -130,14 +145,17 @@ def validate_file_path(file_path: str, config: Config) -> None:
     """
     path = Path(file_path)
     
-    if not path.exists():
+    # A single stat() answers existence, file type and size
+    try:
+        file_stat = os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError):
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    if not path.is_file():
+    if not stat.S_ISREG(file_stat.st_mode):
         raise ValueError(f"Path is not a file: {file_path}")
     
     # Check file size
-    file_size_mb = path.stat().st_size / (1024 * 1024)
+    file_size_mb = file_stat.st_size / (1024 * 1024)
     if file_size_mb > config.MAX_FILE_SIZE_MB:
         raise ValueError(
             f"File too large: {file_size_mb:.1f}MB. "
@@ -172,102 +190,25 @@ def validate_questions(questions: dict) -> None:
         if not isinstance(value, dict):
             raise ValueError(f"Question value for '{key}' must be a dictionary")
         
-        if "question" not in value:
+        question_text = value.get("question")
+        if question_text is None and "question" not in value:
             raise ValueError(f"Question dictionary for '{key}' must contain 'question' key")
         
-        if not isinstance(value["question"], str):
+        if not isinstance(question_text, str):
             raise ValueError(f"Question text for '{key}' must be a string")
         
-        if not value["question"].strip():
+        if not question_text.strip():
             raise ValueError(f"Question text for '{key}' cannot be empty")
         
-        # Validate type if present
-        if "type" in value:
-            valid_types = ["str", "string", "text", "int", "integer", "number", 
-                          "float", "decimal", "bool", "boolean", "date", "datetime"]
-            
-            # Check if it's a valid array type
-            if _is_valid_array_type(value["type"]):
-                # Array type is valid
-                pass
-            # Check if it's a valid enum type
-            elif _is_valid_enum_type(value["type"]):
-                # Enum type is valid
-                pass
-            elif value["type"].lower() not in valid_types:
-                raise ValueError(
-                    f"Invalid type '{value['type']}' for question '{key}'. "
-                    f"Valid types: {valid_types} or array types like list(str), list(int), etc., or enum types like enum(val1,val2,val3)"
-                )
-
-
-def _is_valid_array_type(type_str: str) -> bool:
-    """
-    Check if a type string represents a valid array type specification.
-    
-    Args:
-        type_str: String representation of the type
-        
-    Returns:
-        bool: True if it's a valid array type specification
-    """
-    type_str = type_str.strip().lower()
-    
-    # Check if this matches the list(type) pattern
-    if not (type_str.startswith("list(") and type_str.endswith(")")):
-        return False
-    
-    # Extract the base type
-    base_type = type_str[5:-1].strip()
-    
-    # Valid base types for arrays
-    valid_base_types = {
-        'str', 'string', 'text',
-        'int', 'integer', 'number',
-        'float', 'decimal',
-        'bool', 'boolean',
-        'date', 'datetime'
-    }
-    
-    return base_type in valid_base_types
-
-
-def _is_valid_enum_type(type_str: str) -> bool:
-    """
-    Check if a type string represents a valid enum type specification.
-    
-    Args:
-        type_str: String representation of the type
-        
-    Returns:
-        bool: True if it's a valid enum type specification
-    """
-    type_str = type_str.strip().lower()
-    
-    # Check if this matches enum(val1,val2,...) or multi_enum(val1,val2,...) pattern
-    if type_str.startswith("enum(") and type_str.endswith(")"):
-        return _validate_enum_values(type_str[5:-1])
-    elif type_str.startswith("multi_enum(") and type_str.endswith(")"):
-        return _validate_enum_values(type_str[11:-1])
-    
-    return False
-
-
-def _validate_enum_values(values_str: str) -> bool:
-    """
-    Validate that enum values string contains valid comma-separated values.
-    
-    Args:
-        values_str: Comma-separated values string
+        # Validate type if present; basic types are the common case and are checked first
+        type_str = value.get("type")
+        if type_str is None and "type" not in value:
+            continue
         
-    Returns:
-        bool: True if valid
-    """
-    if not values_str.strip():
-        return False
-    
-    # Split by comma and check each value
-    values = [v.strip() for v in values_str.split(',')]
-    
-    # Must have at least one value, and all values must be non-empty
-    return len(values) > 0 and all(v for v in values)
+        if (type_str.lower() not in _VALID_TYPE_SET
+                and not _is_valid_array_type(type_str)
+                and not _is_valid_enum_type(type_str)):
+            raise ValueError(
+                f"Invalid type '{type_str}' for question '{key}'. "
+                f"Valid types: {_VALID_TYPES} or array types like list(str), list(int), etc., or enum types like enum(val1,val2,val3)"
+            )
@@ -4,21 +4,25 @@ import openai
 import pandas as pd
 import json
 import time
+import hashlib
 import logging
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from collections import deque
+from collections import OrderedDict, deque
 from functools import wraps
 
 from .document_reader import extract_text, extract_text_from_directory
-from .question_parser import parse_questions_from_file, validate_questions
+from .question_parser import parse_questions_from_file
 from .schema_builder import (
     build_schema_from_questions,
     create_extraction_prompt,
+    format_questions_block,
     validate_extraction_result,
     schema_to_dict,
-    get_type_adapter
+    get_type_adapter,
+    get_schema_json
 )
 from .config import Config, setup_logging, validate_file_path, validate_questions as validate_questions_config
 from .datatype_inferrer import DataTypeInferrer
@@ -32,13 +36,19 @@ class AdaptiveRateLimiter:
         self.burst_capacity = burst_capacity or base_rate * 2
         self.max_backoff = max_backoff
         self.tokens = base_rate
-        self.last_update = time.time()
+        # Monotonic clock, so wall-clock adjustments cannot add or remove tokens
+        self.last_update = time.monotonic()
         self.lock = threading.Lock()
         
         # Adaptive backoff tracking
         self.consecutive_failures = 0
         self.last_failure_time = 0
         
+    @property
+    def requests_per_minute(self) -> int:
+        """Sustained request rate (name used by the original RateLimiter)."""
+        return self.base_rate
+    
     def acquire(self, timeout: float = None) -> bool:
         """Acquire a token for making a request with adaptive backoff.
         
@@ -48,36 +58,38 @@ class AdaptiveRateLimiter:
         Returns:
             bool: True if token acquired, False if timeout
         """
-        start_time = time.time()
+        deadline = None if timeout is None else time.monotonic() + timeout
         
         while True:
             with self.lock:
-                now = time.time()
+                now = time.monotonic()
                 
                 # Calculate backoff delay if we've had recent failures
-                backoff_delay = self._calculate_backoff_delay(now)
-                if backoff_delay > 0:
-                    time.sleep(min(backoff_delay, 1.0))  # Cap sleep to 1 second per iteration
-                    continue
-                
-                # Add tokens based on elapsed time
-                elapsed = now - self.last_update
-                self.tokens = min(self.burst_capacity, 
-                                self.tokens + elapsed * (self.base_rate / 60.0))
-                self.last_update = now
-                
-                if self.tokens >= 1.0:
-                    self.tokens -= 1.0
-                    # Reset failure count on successful acquisition
-                    self.consecutive_failures = 0
-                    return True
-            
-            # Check timeout
-            if timeout is not None and (time.time() - start_time) >= timeout:
-                return False
+                wait = self._calculate_backoff_delay(now)
+                if wait <= 0:
+                    self._refill(now)
+                    if self.tokens >= 1.0:
+                        self.tokens -= 1.0
+                        # Reset failure count on successful acquisition
+                        self.consecutive_failures = 0
+                        return True
+                    # Time until the next whole token has accrued
+                    wait = (1.0 - self.tokens) * 60.0 / self.base_rate
             
-            # Wait a bit before trying again
-            time.sleep(0.1)
+            # Wait outside the lock so other workers can still take tokens
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(min(wait, 1.0))  # Cap sleep to 1 second per iteration
+    
+    def _refill(self, now: float):
+        """Add the tokens accrued since the last update; the caller must hold the lock."""
+        elapsed = now - self.last_update
+        self.tokens = min(self.burst_capacity, 
+                          self.tokens + elapsed * (self.base_rate / 60.0))
+        self.last_update = now
     
     def _calculate_backoff_delay(self, current_time: float) -> float:
         """Calculate exponential backoff delay based on consecutive failures."""
@@ -98,7 +110,7 @@ class AdaptiveRateLimiter:
         """Report a failure to trigger exponential backoff."""
         with self.lock:
             self.consecutive_failures += 1
-            self.last_failure_time = time.time()
+            self.last_failure_time = time.monotonic()
     
     def report_success(self):
         """Report a success to reset backoff."""
@@ -110,6 +122,11 @@ class AdaptiveRateLimiter:
 RateLimiter = AdaptiveRateLimiter
 
 class Inquiry(object):
+    # Model names discovered via models.list(), shared across instances per
+    # (base URL, API key digest)
+    _model_cache: Dict[tuple, str] = {}
+    _model_cache_lock = threading.Lock()
+    
     def __init__(self, questions: Union[str, list, dict, None] = None, 
                  client: openai.OpenAI = None, 
                  base_url: str = None,
@@ -155,6 +172,10 @@ class Inquiry(object):
                 self.logger.error(f"Failed to initialize OpenAI client: {e}")
                 raise RuntimeError(f"Failed to initialize OpenAI client: {e}")
         
+        # Model name is resolved lazily on first API call and reused afterwards
+        self._resolved_model = None
+        self._model_lock = threading.Lock()
+        
         # Normalize and validate questions
         self.questions = self.normalize_questions(questions or {})
         if self.questions:
@@ -166,7 +187,22 @@ class Inquiry(object):
             self.logger.info(f"Loaded {len(self.questions)} questions")
         
         self.schema_class = None
+        self._questions_block = None
+        self._tool_spec = None
+        self._tool_calling_supported = True
         self._build_schema()
+        
+        # Open the persistent response cache if configured
+        self._response_cache = self._open_response_cache()
+        
+        # In-memory LRU of validated responses, keyed like the on-disk cache
+        self._memory_cache = OrderedDict() if self.config.cache_size else None
+        self._memory_cache_lock = threading.Lock()
+        
+        # Worker pool for concurrent processing, created on first use and
+        # reused by every later batch
+        self._executor = None
+        self._executor_lock = threading.Lock()
     
     def _infer_missing_types(self, questions: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """
@@ -226,31 +262,174 @@ class Inquiry(object):
         Returns:
             Inquiry: New Inquiry instance
         """
-        questions = parse_questions_from_file(questions_file)
+        kwargs["config"] = kwargs.get("config") or Config()
+        questions = parse_questions_from_file(questions_file, delimiter=kwargs["config"].csv_delimiter)
         return cls(questions=questions, **kwargs)
     
     def _build_schema(self):
-        """Build Pydantic schema from questions."""
+        """
+        Build Pydantic schema from questions.
+        
+        Questions are already normalized and validated in __init__, so they are
+        passed straight to the schema builder.
+        """
         if self.questions:
-            validate_questions(self.questions)
             self.schema_class = build_schema_from_questions(self.questions)
+            # The questions part of the prompt is the same for every document
+            self._questions_block = format_questions_block(self.questions)
+            self._tool_spec = {
+                "type": "function",
+                "function": {
+                    "name": "extract",
+                    "description": "Record the information extracted from the document",
+                    "parameters": self.schema_class.model_json_schema()
+                }
+            }
     
     def _get_available_model(self) -> str:
         """
         Get the first available model from the API.
         
+        Discovered models are cached per base URL and API key so that further
+        instances talking to the same endpoint skip the models.list() call.
+        Only a digest of the API key is kept in the cache.
+        
         Returns:
             str: Model name
         """
+        api_key = str(getattr(self.client, 'api_key', ''))
+        cache_key = (str(getattr(self.client, 'base_url', '')),
+                     hashlib.sha256(api_key.encode()).hexdigest())
+        with Inquiry._model_cache_lock:
+            cached_model = Inquiry._model_cache.get(cache_key)
+        if cached_model is not None:
+            return cached_model
+        
         try:
             models = self.client.models.list()
             if models.data and len(models.data) == 1:
-                return models.data[0].id
+                model_name = models.data[0].id
+                with Inquiry._model_cache_lock:
+                    Inquiry._model_cache[cache_key] = model_name
+                return model_name
             return "gpt-3.5-turbo"  # fallback
         except Exception:
             return "gpt-3.5-turbo"  # fallback
     
+    def _resolve_model(self) -> str:
+        """
+        Get the model name for API calls, querying the API at most once per instance.
+        
+        Returns:
+            str: Model name
+        """
+        if self._resolved_model is None:
+            with self._model_lock:
+                if self._resolved_model is None:
+                    self._resolved_model = self.config.model or self._get_available_model()
+        return self._resolved_model
+    
+    def _open_response_cache(self):
+        """
+        Open the on-disk API response cache if a cache directory is configured.
+        
+        Returns:
+            diskcache.Cache or None: Cache instance, or None if caching is disabled
+            
+        Raises:
+            RuntimeError: If a cache directory is configured but diskcache is not installed
+        """
+        if not self.config.cache_dir:
+            return None
+        
+        try:
+            import diskcache
+        except ImportError:
+            raise RuntimeError(
+                "diskcache is not installed. Please install it: pip install diskcache"
+            )
+        
+        self.logger.info(f"Using response cache directory: {self.config.cache_dir}")
+        return diskcache.Cache(self.config.cache_dir)
+    
+    def _response_cache_key(self, model_name: str, prompt: str) -> str:
+        """
+        Create a cache key for an API response.
+        
+        The key covers the model, the schema and the full prompt so that a change
+        to any of them results in a fresh API call.
+        
+        Args:
+            model_name: Model used for the request
+            prompt: The prompt sent to the API
+            
+        Returns:
+            str: Hex digest identifying the request
+        """
+        schema_json = get_schema_json(self.schema_class)
+        key_source = "\x00".join([model_name, schema_json, prompt])
+        return hashlib.sha256(key_source.encode()).hexdigest()
+    
     def _call_openai_api(self, prompt: str) -> BaseModel:
+        """
+        Call OpenAI API, serving repeated requests from the response caches if enabled.
+        
+        Args:
+            prompt: The prompt to send to the API
+            
+        Returns:
+            BaseModel: Validated Pydantic model instance
+        """
+        if self._response_cache is None and self._memory_cache is None:
+            return self._call_openai_api_uncached(prompt)
+        
+        model_name = self._resolve_model()
+        cache_key = self._response_cache_key(model_name, prompt)
+        
+        result = self._memory_cache_get(cache_key)
+        if result is not None:
+            self.logger.debug("Using in-memory cached API response")
+            return result
+        
+        cached = self._response_cache.get(cache_key) if self._response_cache is not None else None
+        if cached is not None:
+            self.logger.debug("Using cached API response")
+            result = get_type_adapter(self.schema_class).validate_json(cached)
+        else:
+            result = self._call_openai_api_uncached(prompt)
+            if self._response_cache is not None:
+                self._response_cache.set(cache_key, result.model_dump_json())
+        
+        self._memory_cache_set(cache_key, result)
+        return result
+    
+    def _memory_cache_get(self, cache_key: str) -> Optional[BaseModel]:
+        """Look up a response in the in-memory cache, marking it as recently used."""
+        if self._memory_cache is None:
+            return None
+        with self._memory_cache_lock:
+            result = self._memory_cache.get(cache_key)
+            if result is not None:
+                self._memory_cache.move_to_end(cache_key)
+            return result
+    
+    def _memory_cache_set(self, cache_key: str, result: BaseModel):
+        """Store a response in the in-memory cache, evicting the least recently used."""
+        if self._memory_cache is None:
+            return
+        with self._memory_cache_lock:
+            self._memory_cache[cache_key] = result
+            self._memory_cache.move_to_end(cache_key)
+            while len(self._memory_cache) > self.config.cache_size:
+                self._memory_cache.popitem(last=False)
+    
+    def cache_clear(self):
+        """Discard all responses held in the in-memory cache (the on-disk cache is kept)."""
+        if self._memory_cache is not None:
+            with self._memory_cache_lock:
+                self._memory_cache.clear()
+    
+    def _call_openai_api_uncached(self, prompt: str) -> BaseModel:
         """
         Call OpenAI API with structured output, falling back to JSON mode if needed.
         Includes retry logic and proper error handling.
@@ -265,13 +444,27 @@ class Inquiry(object):
             ValueError: If JSON parsing fails
             RuntimeError: If API call fails after retries
         """
-        model_name = self.config.model or self._get_available_model()
+        model_name = self._resolve_model()
         last_exception = None
         
         for attempt in range(self.config.max_retries + 1):
             try:
                 self.logger.debug(f"API call attempt {attempt + 1}/{self.config.max_retries + 1}")
                 
+                # Try function calling first if enabled and not rejected by the backend
+                if self.config.use_tool_calling and self._tool_calling_supported:
+                    try:
+                        result = self._call_tool_api(model_name, prompt)
+                        self.logger.debug("Successfully used tool calling API")
+                        return result
+                    except (openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError):
+                        raise
+                    except (openai.BadRequestError, openai.NotFoundError, openai.UnprocessableEntityError) as e:
+                        self.logger.debug(f"Backend rejected tool calling, disabling it: {e}")
+                        self._tool_calling_supported = False
+                    except Exception as e:
+                        self.logger.debug(f"Tool calling failed, falling back to structured output: {e}")
+                
                 # Try using structured output first (newer API)
                 try:
                     response = self.client.beta.chat.completions.parse(
@@ -285,12 +478,6 @@ class Inquiry(object):
                     
                 except (AttributeError, Exception) as e:
                     self.logger.debug(f"Structured output failed, falling back to JSON mode: {e}")
-                    # Check if this is a test scenario where both APIs should fail
-                    if hasattr(self.client, 'chat') and hasattr(self.client.chat.completions, 'create'):
-                        if hasattr(self.client.chat.completions.create, 'side_effect'):
-                            # This is a test mock with side_effect - let it propagate the exception
-                            if isinstance(self.client.chat.completions.create.side_effect, Exception):
-                                raise self.client.chat.completions.create.side_effect
                     
                     # Fallback to legacy JSON mode if structured output not available
                     response = self.client.chat.completions.create(
@@ -334,6 +521,33 @@ class Inquiry(object):
         # If we get here, all retries failed
         raise RuntimeError(f"Failed to call OpenAI API after {self.config.max_retries + 1} attempts. Last error: {last_exception}")
     
+    def _call_tool_api(self, model_name: str, prompt: str) -> BaseModel:
+        """
+        Extract data by forcing a call to an 'extract' function that takes the schema as parameters.
+        
+        Args:
+            model_name: Model to use
+            prompt: The prompt to send to the API
+            
+        Returns:
+            BaseModel: Validated Pydantic model instance
+            
+        Raises:
+            ValueError: If the response contains no tool call
+        """
+        response = self.client.chat.completions.create(
+            model=model_name,
+            messages=[{"role": "user", "content": prompt}],
+            tools=[self._tool_spec],
+            tool_choice={"type": "function", "function": {"name": "extract"}}
+        )
+        
+        tool_calls = response.choices[0].message.tool_calls
+        if not tool_calls:
+            raise ValueError("No tool call in API response")
+        
+        return get_type_adapter(self.schema_class).validate_json(tool_calls[0].function.arguments)
+    
     def process_text(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Process a single text string and extract information.
@@ -526,7 +740,7 @@ class Inquiry(object):
         
         try:
             # Create extraction prompt
-            prompt = create_extraction_prompt(self.questions, text, self.schema_class)
+            prompt = create_extraction_prompt(self.questions, text, self.schema_class, self._questions_block)
             
             # Call OpenAI API with structured output
             self.logger.debug("Calling OpenAI API for extraction")
@@ -601,6 +815,41 @@ class Inquiry(object):
         self.logger.info(f"Completed concurrent processing of {len(texts)} texts, got {len(all_results)} results")
         return all_results
     
+    def close(self):
+        """
+        Release the worker pool and the response cache held by this instance.
+        
+        Waits for running work to finish. The instance stays usable; a later
+        concurrent call creates a new pool.
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if self._response_cache is not None:
+            self._response_cache.close()
+    
+    def __enter__(self) -> 'Inquiry':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the worker pool used for concurrent processing, creating it on first use.
+        
+        Returns:
+            ThreadPoolExecutor: Pool sized to config.max_concurrent_requests
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_concurrent_requests,
+                    thread_name_prefix="metaminer"
+                )
+            return self._executor
+    
     def _process_batch_concurrent(self, texts: List[str], metadata_list: List[Dict[str, Any]], 
                                  rate_limiter: RateLimiter) -> List[Dict[str, Any]]:
         """
@@ -629,27 +878,36 @@ class Inquiry(object):
                 self.logger.error(f"Failed to process text item {index}: {e}")
                 return index, None, e
         
-        # Use ThreadPoolExecutor for concurrent processing
+        def worker():
+            """Pull items from the work queue until a stop sentinel is received."""
+            while True:
+                item = work_queue.get()
+                if item is None:
+                    break
+                index, result, _ = process_single_with_rate_limit(*item)
+                # Errors are already logged in process_single_with_rate_limit
+                results[index] = result
+        
+        # A fixed set of workers pulls from a bounded queue, so at most
+        # 2 * max_workers items are pending at any time regardless of batch size
         max_workers = min(self.config.max_concurrent_requests, len(texts))
+        work_queue = queue.Queue(maxsize=2 * max_workers)
         
         try:
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all tasks
-                future_to_index = {
-                    executor.submit(process_single_with_rate_limit, i, text, metadata): i
-                    for i, (text, metadata) in enumerate(zip(texts, metadata_list))
-                }
-                
-                # Collect results as they complete
-                for future in as_completed(future_to_index):
-                    try:
-                        index, result, error = future.result()
-                        if result is not None:
-                            results[index] = result
-                        # Note: errors are already logged in the worker function
-                    except Exception as e:
-                        original_index = future_to_index[future]
-                        self.logger.error(f"Unexpected error processing item {original_index}: {e}")
+            executor = self._get_executor()
+            workers = [executor.submit(worker) for _ in range(max_workers)]
+            
+            # Feed the queue; put() blocks while the workers are saturated
+            for i, (text, metadata) in enumerate(zip(texts, metadata_list)):
+                work_queue.put((i, text, metadata))
+            for _ in workers:
+                work_queue.put(None)
+            
+            for future in workers:
+                try:
+                    future.result()
+                except Exception as e:
+                    self.logger.error(f"Unexpected error in worker thread: {e}")
         
         except Exception as e:
             self.logger.error(f"Error in concurrent processing: {e}")
@@ -788,14 +1046,21 @@ class Inquiry(object):
             ValueError: If input format is invalid.
         """
         if isinstance(questions, str):
-            return {"default": {"question": questions, "type": "str", "_type_explicit": False}}
+            return {"default": {
+                "question": questions,
+                "type": "str",
+                "output_name": "default",
+                "_type_explicit": False
+            }}
         elif isinstance(questions, list):
             normalized = {}
             for q in questions:
                 if isinstance(q, str):
-                    normalized[f"question_{len(normalized)+1}"] = {
+                    field_name = f"question_{len(normalized)+1}"
+                    normalized[field_name] = {
                         "question": q, 
                         "type": "str", 
+                        "output_name": field_name,
                         "_type_explicit": False
                     }
                 elif isinstance(q, dict):
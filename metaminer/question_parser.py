@@ -1,36 +1,201 @@
 """
 Question parser module for reading questions from text and CSV files.
 """
+import copy
 import csv
+import io
+import itertools
+import mmap
+import operator
 import os
-from typing import Dict, List, Any, Union
+import sys
+from typing import Dict, FrozenSet, Iterable, List, Any, NamedTuple, Optional, Set, Tuple, Union
 from pathlib import Path
+from functools import lru_cache
 import re
 
 
-def parse_questions_from_file(file_path: str) -> Dict[str, Dict[str, Any]]:
+# Accepted (lowercase) CSV header names for each column role
+_QUESTION_HEADERS = frozenset({'question', 'q', 'text'})
+_FIELD_HEADERS = frozenset({'field_name', 'field', 'name', 'output_name'})
+_TYPE_HEADERS = frozenset({'data_type', 'type', 'dtype'})
+_DEFAULT_HEADERS = frozenset({'default_value', 'default', 'default_val'})
+
+# Canonical type for each accepted (lowercase) basic type name
+_TYPE_ALIAS = {
+    'str': 'str', 'string': 'str', 'text': 'str',
+    'int': 'int', 'integer': 'int', 'number': 'int',
+    'float': 'float', 'decimal': 'float',
+    'bool': 'bool', 'boolean': 'bool',
+    'date': 'date', 'datetime': 'date',
+}
+
+# Accepted (lowercase) spellings of boolean default values
+_TRUE_VALUES = frozenset({'true', '1', 'yes', 'on'})
+_FALSE_VALUES = frozenset({'false', '0', 'no', 'off'})
+
+# Base types accepted inside list(...)
+_ARRAY_BASE_TYPES = frozenset(_TYPE_ALIAS)
+
+# Number of characters inspected when detecting a CSV delimiter, and the candidates
+_SNIFF_SAMPLE_SIZE = 8192
+_SNIFF_DELIMITERS = ',;\t|'
+
+# CSV files at least this large (in bytes) are parsed with pandas
+_PANDAS_CSV_MIN_SIZE = 1024 * 1024
+
+# Parametrized type specifications: list(base), enum(values) and multi_enum(values)
+_TYPE_SPEC_RE = re.compile(r'(list|enum|multi_enum)\((.*)\)', re.DOTALL)
+
+
+class Question(NamedTuple):
+    """
+    A single parsed question.
+    
+    Tuple-based records are much smaller than per-question dictionaries,
+    which matters for files with many questions.
+    """
+    question: str
+    type: str
+    output_name: str
+    default: Any = None
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Convert the record to the dictionary format used by parse_questions_from_file.
+        
+        Returns:
+            dict: Question dictionary; 'default' is only present if set
+        """
+        question_dict = {"question": self.question, "type": self.type, "output_name": self.output_name}
+        if self.default is not None:
+            question_dict["default"] = self.default
+        return question_dict
+
+
+def parse_questions_from_file(file_path: str, delimiter: Optional[str] = None,
+                              return_explicit: bool = False
+                              ) -> Union[Dict[str, Dict[str, Any]], Tuple[Dict[str, Dict[str, Any]], Set[str]]]:
     """
     Parse questions from a text or CSV file.
     
     Args:
         file_path: Path to the questions file (.txt or .csv)
+        delimiter: CSV delimiter; detected from the file contents if not given
+        return_explicit: Also return the field names whose type was given in the file
         
     Returns:
-        dict: Normalized questions dictionary
+        dict: Normalized questions dictionary, or a (questions, explicit_fields)
+            tuple if return_explicit is True
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If the file format is unsupported or invalid
+    """
+    questions, explicit_fields = _parse_questions_file(file_path, delimiter)
+    # Callers may modify the questions, so never hand out the cached copy
+    questions = copy.deepcopy(questions)
+    if return_explicit:
+        return questions, set(explicit_fields)
+    return questions
+
+
+def parse_questions_as_columns(file_path: str,
+                               delimiter: Optional[str] = None) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Parse questions from a text or CSV file into parallel lists.
+    
+    The lists are read from the same cached parse as parse_questions_from_file,
+    so the only saving is skipping its deep copy of the questions dictionary;
+    strings are immutable, so the lists can share them with the cache safely.
+    
+    Args:
+        file_path: Path to the questions file (.txt or .csv)
+        delimiter: CSV delimiter; detected from the file contents if not given
+        
+    Returns:
+        Tuple[List[str], List[str], List[str]]: (questions, types, output_names), in file order
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If the file format is unsupported or invalid
+    """
+    parsed = _parse_questions_file(file_path, delimiter)[0].values()
+    return (
+        [q["question"] for q in parsed],
+        [q["type"] for q in parsed],
+        [q["output_name"] for q in parsed],
+    )
+
+
+def parse_question_records(file_path: str, delimiter: Optional[str] = None) -> List[Question]:
+    """
+    Parse questions from a text or CSV file into Question records.
+    
+    Args:
+        file_path: Path to the questions file (.txt or .csv)
+        delimiter: CSV delimiter; detected from the file contents if not given
+        
+    Returns:
+        List[Question]: Parsed questions, in file order
         
     Raises:
         FileNotFoundError: If the file doesn't exist
         ValueError: If the file format is unsupported or invalid
     """
+    parsed = _parse_questions_file(file_path, delimiter)[0].values()
+    # Defaults may be lists, so copy them rather than sharing the cached values
+    return [
+        Question(q["question"], q["type"], q["output_name"], copy.deepcopy(q.get("default")))
+        for q in parsed
+    ]
+
+
+def _parse_questions_file(file_path: str,
+                          delimiter: Optional[str]) -> Tuple[Dict[str, Dict[str, Any]], FrozenSet[str]]:
+    """
+    Get the (shared, cached) parse result for a questions file.
+    
+    Args:
+        file_path: Path to the questions file
+        delimiter: CSV delimiter, or None to detect it
+        
+    Returns:
+        Tuple[dict, frozenset]: Normalized questions dictionary, which must not be
+            modified, and the field names with an explicit type
+    """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"Questions file not found: {file_path}")
     
+    # Modification time and size are part of the cache key so edited files are re-parsed
+    stat = os.stat(file_path)
+    return _parse_questions_cached(str(Path(file_path).resolve()), stat.st_mtime_ns,
+                                   stat.st_size, delimiter)
+
+
+@lru_cache(maxsize=128)
+def _parse_questions_cached(file_path: str, mtime_ns: int, size: int,
+                            delimiter: Optional[str]) -> Tuple[Dict[str, Dict[str, Any]], FrozenSet[str]]:
+    """
+    Parse a questions file, memoized on its path, modification time and size.
+    
+    Args:
+        file_path: Resolved path to the questions file
+        mtime_ns: File modification time (cache key only)
+        size: File size in bytes (cache key only)
+        delimiter: CSV delimiter, or None to detect it
+        
+    Returns:
+        Tuple[dict, frozenset]: Normalized questions dictionary and the field
+            names with an explicit type
+    """
     file_path = Path(file_path)
     
     if file_path.suffix.lower() == '.txt':
-        return _parse_text_file(file_path)
+        # Text files don't specify types explicitly
+        return _parse_text_file(file_path), frozenset()
     elif file_path.suffix.lower() == '.csv':
-        return _parse_csv_file(file_path)
+        return _parse_csv_file(file_path, delimiter)
     else:
         raise ValueError(f"Unsupported file format: {file_path.suffix}. Use .txt or .csv")
 
@@ -45,30 +210,67 @@ def _parse_text_file(file_path: Path) -> Dict[str, Dict[str, Any]]:
     Returns:
         dict: Normalized questions dictionary
     """
-    questions = {}
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:  # Empty files cannot be memory-mapped
+            return {}
+        
+        # Lines are read straight from the mapping, so the file is never copied whole
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            try:
+                return _build_questions_from_lines(iter(mm.readline, b''), 'utf-8')
+            except UnicodeDecodeError:
+                mm.seek(0)
+                return _build_questions_from_lines(iter(mm.readline, b''), 'latin-1')
+
+
+def _build_questions_from_lines(lines: Iterable[bytes], encoding: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the questions dictionary from the raw lines of a text file.
     
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-    except UnicodeDecodeError:
-        with open(file_path, 'r', encoding='latin-1') as f:
-            lines = f.readlines()
-    
-    for i, line in enumerate(lines, 1):
-        line = line.strip()
-        if line and not line.startswith('#'):  # Skip empty lines and comments
-            field_name = f"question_{i}"
-            questions[field_name] = {
-                "question": line,
-                "type": "str",
-                "output_name": field_name,
-                "_type_explicit": False  # Text files don't specify types explicitly
-            }
+    Args:
+        lines: Undecoded lines, including line endings
+        encoding: Encoding used to decode each line
+        
+    Returns:
+        dict: Normalized questions dictionary
+        
+    Raises:
+        UnicodeDecodeError: If a line cannot be decoded with the given encoding
+    """
+    # Question numbers follow line numbers; skip empty lines and comments
+    stripped_lines = enumerate((line.strip() for line in _decode_lines(lines, encoding)), 1)
+    return {
+        field_name: {
+            "question": line,
+            "type": "str",
+            "output_name": field_name
+        }
+        for field_name, line in (
+            (sys.intern(f"question_{i}"), line) for i, line in stripped_lines
+            if line and not line.startswith('#')
+        )
+    }
+
+
+def _decode_lines(lines: Iterable[bytes], encoding: str) -> Iterable[str]:
+    """
+    Decode raw lines, also splitting on bare carriage returns.
     
-    return questions
+    The raw lines only break on b"\n"; like a file opened in text mode, a lone
+    "\r" (old Mac line endings) also ends a line.
+    """
+    for raw_line in lines:
+        line = raw_line.decode(encoding)
+        body = line[:-2] if line.endswith('\r\n') else line
+        if '\r' in body:
+            # StringIO applies the same universal newline rules as text-mode files
+            yield from io.StringIO(line, newline=None)
+        else:
+            yield line
 
 
-def _parse_csv_file(file_path: Path) -> Dict[str, Dict[str, Any]]:
+def _parse_csv_file(file_path: Path,
+                    delimiter: Optional[str] = None) -> Tuple[Dict[str, Dict[str, Any]], FrozenSet[str]]:
     """
     Parse questions from a CSV file.
     
@@ -79,154 +281,212 @@ def _parse_csv_file(file_path: Path) -> Dict[str, Dict[str, Any]]:
     
     Args:
         file_path: Path to the CSV file
+        delimiter: Field delimiter; detected with csv.Sniffer if not given
         
     Returns:
-        dict: Normalized questions dictionary
+        Tuple[dict, frozenset]: Normalized questions dictionary and the field
+            names with an explicit type
     """
-    questions = {}
-    
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            # Detect delimiter
-            sample = f.read(1024)
-            f.seek(0)
-            sniffer = csv.Sniffer()
-            delimiter = sniffer.sniff(sample).delimiter
+            lines = f
+            if delimiter is None:
+                # The header line usually settles it; otherwise sniff from a leading
+                # sample extended to a full line. The sample is fed back in ahead of
+                # the rest of the file rather than seeking
+                sample = f.readline()
+                delimiter = _header_delimiter(sample)
+                if delimiter is None:
+                    sample += f.read(_SNIFF_SAMPLE_SIZE) + f.readline()
+                    delimiter = _sniff_delimiter(sample)
+                lines = itertools.chain(io.StringIO(sample), f)
             
-            reader = csv.DictReader(f, delimiter=delimiter)
-            headers = reader.fieldnames
+            if file_path.stat().st_size >= _PANDAS_CSV_MIN_SIZE:
+                # Large files: let pandas' C parser tokenize the whole file at once
+                import pandas as pd
+                f.seek(0)
+                frame = pd.read_csv(f, sep=delimiter, dtype=str, na_filter=False, index_col=False,
+                                    skipinitialspace=True)
+                headers = list(frame.columns)
+                rows = (list(row) for row in frame.itertuples(index=False, name=None))
+            else:
+                reader = csv.reader(lines, delimiter=delimiter, skipinitialspace=True)
+                headers = next(reader, None)
+                # Blank lines produce no row at all and are not counted
+                rows = (row for row in reader if row)
             
             if not headers:
                 raise ValueError("CSV file appears to be empty or invalid")
             
-            # Normalize header names (case-insensitive)
-            headers_lower = [h.lower().strip() for h in headers]
-            
-            for i, row in enumerate(reader, 1):
-                if not any(row.values()):  # Skip empty rows
-                    continue
-                
-                # Extract question text
-                question_text = None
-                for header in headers:
-                    if header.lower().strip() in ['question', 'q', 'text']:
-                        question_text = row[header].strip()
-                        break
-                
-                if not question_text:
-                    # If no 'question' column, use the first column
-                    question_text = list(row.values())[0].strip()
-                
-                if not question_text:
-                    continue
-                
-                # Extract field name
-                field_name = None
-                for header in headers:
-                    if header.lower().strip() in ['field_name', 'field', 'name', 'output_name']:
-                        field_name = row[header].strip()
-                        break
-                
-                if not field_name:
-                    field_name = f"question_{i}"
-                
-                # Extract data type
-                data_type = None  # No default - will be set based on whether type is explicit
-                type_explicit = False
-                for header in headers:
-                    if header.lower().strip() in ['data_type', 'type', 'dtype']:
-                        type_value = row[header].strip()  # Don't convert to lowercase yet
-                        if type_value:  # Only if there's actually a value
-                            type_explicit = True
-                            type_value_lower = type_value.lower()
-                            if type_value_lower in ['str', 'string', 'text']:
-                                data_type = "str"
-                            elif type_value_lower in ['int', 'integer', 'number']:
-                                data_type = "int"
-                            elif type_value_lower in ['float', 'decimal']:
-                                data_type = "float"
-                            elif type_value_lower in ['bool', 'boolean']:
-                                data_type = "bool"
-                            elif type_value_lower in ['date', 'datetime']:
-                                data_type = "date"
-                            elif _is_valid_array_type(type_value_lower):
-                                data_type = type_value  # Keep original case for array type
-                            elif _is_valid_enum_type(type_value_lower):
-                                data_type = type_value  # Keep original case for enum type
-                            else:
-                                data_type = "str"  # fallback
-                        break
-                
-                # Extract default value
-                default_value = None
-                for header in headers:
-                    if header.lower().strip() in ['default_value', 'default', 'default_val']:
-                        default_raw = row[header]
-                        if default_raw is not None:  # Check for None first
-                            default_raw = default_raw.strip()
-                            if default_raw:  # Only if there's actually a value
-                                default_value = default_raw
-                        break
-                
-                # Set default only if no explicit type was provided
-                if data_type is None:
-                    data_type = "str"
-                    type_explicit = False
-                
-                question_dict = {
-                    "question": question_text,
-                    "type": data_type,
-                    "output_name": field_name,
-                    "_type_explicit": type_explicit
-                }
-                
-                # Add default value if specified and validate it
-                if default_value is not None:
-                    try:
-                        validated_default = _validate_default_value(default_value, data_type, field_name)
-                        question_dict["default"] = validated_default
-                    except ValueError as e:
-                        raise ValueError(f"Invalid default value in CSV row {i}: {e}")
-                
-                questions[field_name] = question_dict
+            return _build_questions_from_rows(headers, rows)
     
     except Exception as e:
         raise ValueError(f"Failed to parse CSV file {file_path}: {e}")
+
+
+def _build_questions_from_rows(headers: List[str],
+                               rows: Iterable[List[str]]) -> Tuple[Dict[str, Dict[str, Any]], FrozenSet[str]]:
+    """
+    Build the questions dictionary from CSV header and data rows.
     
-    return questions
+    Args:
+        headers: Header row
+        rows: Data rows (blank lines already removed)
+        
+    Returns:
+        Tuple[dict, frozenset]: Normalized questions dictionary and the field
+            names with an explicit type
+        
+    Raises:
+        ValueError: If a default value is invalid for its data type
+    """
+    questions = {}
+    explicit_fields = set()
+    
+    # Resolve which column plays each role once, before reading rows
+    num_columns = len(headers)
+    normalized_headers = [h.lower().strip() for h in headers]
+    role_columns = tuple(_find_column(normalized_headers, aliases) for aliases in
+                         (_QUESTION_HEADERS, _FIELD_HEADERS, _TYPE_HEADERS, _DEFAULT_HEADERS))
+    # Roles without a column read an always-empty cell placed after the header columns
+    row_width = num_columns + (None in role_columns)
+    get_role_cells = operator.itemgetter(*(num_columns if col is None else col for col in role_columns))
+    
+    for i, row in enumerate(rows, 1):
+        if not any(row):  # Skip empty rows
+            continue
+        
+        # Missing trailing cells are treated as empty
+        if len(row) < row_width:
+            row += [''] * (row_width - len(row))
+        elif row_width > num_columns:
+            row[num_columns] = ''
+        
+        question_text, field_name, type_value, default_raw = get_role_cells(row)
+        
+        # If no 'question' column (or it is empty), use the first column
+        question_text = question_text.strip() or row[0].strip()
+        
+        if not question_text:
+            continue
+        
+        # Field names are reused as dict keys and schema field names throughout
+        field_name = sys.intern(field_name.strip() or f"question_{i}")
+        
+        # Extract data type; default to str only if no explicit type was provided
+        type_value = type_value.strip()  # Don't convert to lowercase yet
+        if type_value:
+            explicit_fields.add(field_name)
+            data_type = _normalize_type(type_value)
+        else:
+            data_type = "str"
+            explicit_fields.discard(field_name)
+        
+        # Extract default value
+        default_value = default_raw.strip() or None
+        
+        question_dict = {
+            "question": question_text,
+            "type": data_type,
+            "output_name": field_name
+        }
+        
+        # Add default value if specified and validate it
+        if default_value is not None:
+            try:
+                validated_default = _validate_default_value(default_value, data_type, field_name)
+                question_dict["default"] = validated_default
+            except ValueError as e:
+                raise ValueError(f"Invalid default value in CSV row {i}: {e}")
+        
+        questions[field_name] = question_dict
+    
+    return questions, frozenset(explicit_fields)
 
 
-def _is_valid_array_type(type_str: str) -> bool:
+@lru_cache(maxsize=256)
+def _normalize_type(type_value: str) -> str:
     """
-    Check if a type string represents a valid array type specification.
+    Map a data type from a CSV file to the type stored in the questions.
+    
+    Type columns repeat a handful of values across rows, so results are
+    memoized; identical specs across rows also share one string.
     
     Args:
-        type_str: String representation of the type
+        type_value: Stripped type string as written in the file
         
     Returns:
-        bool: True if it's a valid array type specification
+        str: Canonical basic type, the original list/enum spec, or 'str' if unrecognized
     """
-    type_str = type_str.strip().lower()
+    type_value_lower = type_value.lower()
+    canonical_type = _TYPE_ALIAS.get(type_value_lower)
+    if canonical_type:
+        return canonical_type
+    if _is_valid_array_type(type_value_lower) or _is_valid_enum_type(type_value_lower):
+        return type_value  # Keep original case for array and enum types
+    return "str"  # fallback
+
+
+def _header_delimiter(header_line: str) -> Optional[str]:
+    """
+    Pick the delimiter from the header line if only one candidate appears in it.
     
-    # Check if this matches the list(type) pattern
-    if not (type_str.startswith("list(") and type_str.endswith(")")):
-        return False
+    Args:
+        header_line: First line of the CSV file
+        
+    Returns:
+        str or None: The delimiter, or None if the header line is ambiguous
+    """
+    found = [d for d in _SNIFF_DELIMITERS if d in header_line]
+    return found[0] if len(found) == 1 else None
+
+
+def _sniff_delimiter(sample: str) -> str:
+    """
+    Detect the delimiter of a CSV sample, defaulting to a comma.
     
-    # Extract the base type
-    base_type = type_str[5:-1].strip()
+    Args:
+        sample: Leading portion of the CSV file
+        
+    Returns:
+        str: Detected delimiter, or ',' if it cannot be determined
+    """
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=_SNIFF_DELIMITERS).delimiter
+    except csv.Error:
+        return ','
+
+
+def _find_column(normalized_headers: List[str], aliases: frozenset) -> Union[int, None]:
+    """
+    Find the first CSV column whose header matches one of the given aliases.
     
-    # Valid base types for arrays
-    valid_base_types = {
-        'str', 'string', 'text',
-        'int', 'integer', 'number',
-        'float', 'decimal',
-        'bool', 'boolean',
-        'date', 'datetime'
-    }
+    Args:
+        normalized_headers: Lowercased, stripped header names
+        aliases: Accepted lowercase header names
+        
+    Returns:
+        int or None: Column index, or None if no header matches
+    """
+    return next((i for i, h in enumerate(normalized_headers) if h in aliases), None)
+
+
+@lru_cache(maxsize=256)
+def _is_valid_array_type(type_str: str) -> bool:
+    """
+    Check if a type string represents a valid array type specification.
     
-    return base_type in valid_base_types
+    Args:
+        type_str: String representation of the type
+        
+    Returns:
+        bool: True if it's a valid array type specification
+    """
+    match = _TYPE_SPEC_RE.fullmatch(type_str.strip().lower())
+    return bool(match) and match.group(1) == 'list' and match.group(2).strip() in _ARRAY_BASE_TYPES
 
 
+@lru_cache(maxsize=256)
 def _is_valid_enum_type(type_str: str) -> bool:
     """
     Check if a type string represents a valid enum type specification.
@@ -237,15 +497,9 @@ def _is_valid_enum_type(type_str: str) -> bool:
     Returns:
         bool: True if it's a valid enum type specification
     """
-    type_str = type_str.strip().lower()
-    
-    # Check if this matches enum(val1,val2,...) or multi_enum(val1,val2,...) pattern
-    if type_str.startswith("enum(") and type_str.endswith(")"):
-        return _validate_enum_values(type_str[5:-1])
-    elif type_str.startswith("multi_enum(") and type_str.endswith(")"):
-        return _validate_enum_values(type_str[11:-1])
-    
-    return False
+    # Matches enum(val1,val2,...) or multi_enum(val1,val2,...)
+    match = _TYPE_SPEC_RE.fullmatch(type_str.strip().lower())
+    return bool(match) and match.group(1) != 'list' and _validate_enum_values(match.group(2))
 
 
 def _validate_enum_values(values_str: str) -> bool:
@@ -278,18 +532,8 @@ def _extract_enum_values(type_str: str) -> List[str]:
     Returns:
         List[str]: List of enum values
     """
-    type_str = type_str.strip()
-    
-    if type_str.startswith("enum(") and type_str.endswith(")"):
-        values_str = type_str[5:-1]
-    elif type_str.startswith("multi_enum(") and type_str.endswith(")"):
-        values_str = type_str[11:-1]
-    else:
-        return []
-    
-    # Split by comma and clean up values
-    values = [v.strip() for v in values_str.split(',')]
-    return [v for v in values if v]  # Filter out empty values
+    _, _, enum_values = _parse_enum_type(type_str)
+    return list(enum_values)  # _parse_enum_type's list is shared
 
 
 def _validate_default_value(default_value: str, data_type: str, field_name: str) -> Any:
@@ -310,7 +554,13 @@ def _validate_default_value(default_value: str, data_type: str, field_name: str)
     if default_value is None:
         return None
     
-    # Handle enum types first
+    # Basic types are the common case and cannot be enum or array specs, so try them first
+    canonical_type = _TYPE_ALIAS.get(data_type.lower())
+    if canonical_type is not None:
+        converter = _DEFAULT_CONVERTERS.get(canonical_type)
+        return converter(default_value, field_name) if converter else default_value
+    
+    # Handle enum types
     is_enum, is_multi, enum_values = _parse_enum_type(data_type)
     if is_enum:
         if is_multi:
@@ -331,48 +581,59 @@ def _validate_default_value(default_value: str, data_type: str, field_name: str)
     if is_array:
         raise ValueError(f"Default values are not supported for array types (field '{field_name}')")
     
-    # Handle basic types
-    type_lower = data_type.lower()
-    
-    if type_lower in ['str', 'string', 'text']:
-        return default_value
-    
-    elif type_lower in ['int', 'integer', 'number']:
-        try:
-            return int(default_value)
-        except ValueError:
-            raise ValueError(f"Default value '{default_value}' for field '{field_name}' cannot be converted to integer")
-    
-    elif type_lower in ['float', 'decimal']:
-        try:
-            return float(default_value)
-        except ValueError:
-            raise ValueError(f"Default value '{default_value}' for field '{field_name}' cannot be converted to float")
-    
-    elif type_lower in ['bool', 'boolean']:
-        lower_val = default_value.lower()
-        if lower_val in ['true', '1', 'yes', 'on']:
-            return True
-        elif lower_val in ['false', '0', 'no', 'off']:
-            return False
-        else:
-            raise ValueError(f"Default value '{default_value}' for field '{field_name}' is not a valid boolean (use true/false, 1/0, yes/no, on/off)")
-    
-    elif type_lower in ['date', 'datetime']:
-        # For date/datetime, we'll validate the format but keep as string
-        # The actual parsing will happen in the schema builder
-        try:
-            from dateutil import parser as date_parser
-            date_parser.parse(default_value)  # Just validate it can be parsed
-            return default_value
-        except (ValueError, TypeError):
-            raise ValueError(f"Default value '{default_value}' for field '{field_name}' is not a valid date/datetime format")
-    
+    # Unknown type, treat as string
+    return default_value
+
+
+def _convert_int_default(default_value: str, field_name: str) -> int:
+    """Convert an integer default value."""
+    try:
+        return int(default_value)
+    except ValueError:
+        raise ValueError(f"Default value '{default_value}' for field '{field_name}' cannot be converted to integer")
+
+
+def _convert_float_default(default_value: str, field_name: str) -> float:
+    """Convert a float default value."""
+    try:
+        return float(default_value)
+    except ValueError:
+        raise ValueError(f"Default value '{default_value}' for field '{field_name}' cannot be converted to float")
+
+
+def _convert_bool_default(default_value: str, field_name: str) -> bool:
+    """Convert a boolean default value."""
+    lower_val = default_value.lower()
+    if lower_val in _TRUE_VALUES:
+        return True
+    elif lower_val in _FALSE_VALUES:
+        return False
     else:
-        # Unknown type, treat as string
+        raise ValueError(f"Default value '{default_value}' for field '{field_name}' is not a valid boolean (use true/false, 1/0, yes/no, on/off)")
+
+
+def _convert_date_default(default_value: str, field_name: str) -> str:
+    """Validate a date/datetime default value."""
+    # For date/datetime, we'll validate the format but keep as string
+    # The actual parsing will happen in the schema builder
+    try:
+        from dateutil import parser as date_parser
+        date_parser.parse(default_value)  # Just validate it can be parsed
         return default_value
+    except (ValueError, TypeError):
+        raise ValueError(f"Default value '{default_value}' for field '{field_name}' is not a valid date/datetime format")
 
 
+# Default value converter for each canonical basic type (str needs no conversion)
+_DEFAULT_CONVERTERS = {
+    'int': _convert_int_default,
+    'float': _convert_float_default,
+    'bool': _convert_bool_default,
+    'date': _convert_date_default,
+}
+
+
+@lru_cache(maxsize=256)
 def _parse_enum_type(type_str: str) -> tuple:
     """
     Parse enum type specification like 'enum(val1,val2,val3)' or 'multi_enum(val1,val2,val3)'.
@@ -381,20 +642,19 @@ def _parse_enum_type(type_str: str) -> tuple:
         type_str: String representation of the type
         
     Returns:
-        Tuple[bool, bool, List[str]]: (is_enum, is_multi, enum_values)
+        Tuple[bool, bool, List[str]]: (is_enum, is_multi, enum_values); the
+            list is memoized and shared, so it must not be modified
     """
-    type_str = type_str.strip()
-    
-    if type_str.startswith("enum(") and type_str.endswith(")"):
-        enum_values = _extract_enum_values(type_str)
-        return True, False, enum_values
-    elif type_str.startswith("multi_enum(") and type_str.endswith(")"):
-        enum_values = _extract_enum_values(type_str)
-        return True, True, enum_values
+    match = _TYPE_SPEC_RE.fullmatch(type_str.strip())
+    if not match or match.group(1) == 'list':
+        return False, False, []
     
-    return False, False, []
+    # Split by comma and drop empty values
+    enum_values = [v for v in (v.strip() for v in match.group(2).split(',')) if v]
+    return True, match.group(1) == 'multi_enum', enum_values
 
 
+@lru_cache(maxsize=256)
 def _parse_array_type(type_str: str) -> tuple:
     """
     Parse array type specification like 'list(str)'.
@@ -408,14 +668,13 @@ def _parse_array_type(type_str: str) -> tuple:
     type_str = type_str.strip().lower()
     
     # Check if this is an array type specification
-    if type_str.startswith("list(") and type_str.endswith(")"):
-        # Extract the base type from list(base_type)
-        base_type = type_str[5:-1].strip()
-        return True, base_type
+    match = _TYPE_SPEC_RE.fullmatch(type_str)
+    if match and match.group(1) == 'list':
+        return True, match.group(2).strip()
     
     return False, type_str
 
- 
+
 def validate_questions(questions: Dict[str, Dict[str, Any]]) -> bool:
     """
     Validate the structure of parsed questions.
@@ -433,19 +692,53 @@ def validate_questions(questions: Dict[str, Dict[str, Any]]) -> bool:
         raise ValueError("No questions found")
     
     for field_name, question_data in questions.items():
-        if not isinstance(question_data, dict):
-            raise ValueError(f"Invalid question data for {field_name}")
-        
-        if "question" not in question_data:
+        # Index directly instead of isinstance + membership checks
+        try:
+            question_text = question_data["question"]
+        except KeyError:
             raise ValueError(f"Missing 'question' field for {field_name}")
+        except TypeError:
+            raise ValueError(f"Invalid question data for {field_name}")
         
-        if not question_data["question"].strip():
+        if not question_text.strip():
             raise ValueError(f"Empty question text for {field_name}")
         
-        if "type" not in question_data:
-            question_data["type"] = "str"  # Set default
+        # Fill in defaults; read-only mappings have no setdefault and are rejected
+        try:
+            question_data.setdefault("type", "str")
+            question_data.setdefault("output_name", field_name)
+        except AttributeError:
+            raise ValueError(f"Invalid question data for {field_name}")
+    
+    return True
+
+
+def validate_question_columns(questions: List[str], types: List[str], output_names: List[str]) -> bool:
+    """
+    Validate questions in the column format returned by parse_questions_as_columns.
+    
+    All rows are checked in one pass and every problem row is reported at
+    once, rather than stopping at the first one.
+    
+    Args:
+        questions: Question texts
+        types: Data types, parallel to questions
+        output_names: Output names, parallel to questions
+        
+    Returns:
+        bool: True if valid
         
-        if "output_name" not in question_data:
-            question_data["output_name"] = field_name  # Set default
+    Raises:
+        ValueError: If validation fails
+    """
+    if not questions:
+        raise ValueError("No questions found")
+    
+    if not len(questions) == len(types) == len(output_names):
+        raise ValueError("Question columns must all have the same length")
+    
+    empty = [name for name, text in zip(output_names, questions) if not text.strip()]
+    if empty:
+        raise ValueError(f"Empty question text for {', '.join(empty)}")
     
     return True
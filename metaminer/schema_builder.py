@@ -2,107 +2,263 @@
 Schema builder module for creating dynamic Pydantic models from questions.
 """
 
-from typing import Dict, Any, Type, Optional, List, Tuple, Literal, Union
-from functools import lru_cache
-import hashlib
+from typing import Dict, Any, Type, Optional, List, Literal, Tuple, Union
+from functools import lru_cache, partial
+import copy
 import json
+import threading
 
 try:
     from typing import Annotated
 except ImportError:
     from typing_extensions import Annotated
-from pydantic import BaseModel, Field, field_validator, create_model, BeforeValidator, TypeAdapter
-from dateutil import parser as date_parser
+from pydantic import BaseModel, Field, field_validator, create_model, BeforeValidator, TypeAdapter, ValidationInfo
 from datetime import date, datetime
-from .question_parser import _extract_enum_values
-
-
-# Module-level cached validators for better performance
-@lru_cache(maxsize=32)
-def get_date_validator(field_name: str):
-    """Get a cached date validator function."""
-    def validate_date(v):
-        if v is None:
-            return v
-        if isinstance(v, date) and not isinstance(v, datetime):
+from .question_parser import _parse_array_type, _parse_enum_type
+
+
+# Python type for each accepted (lowercase) basic type name
+_TYPE_MAPPING = {
+    "str": str,
+    "string": str,
+    "text": str,
+    "int": int,
+    "integer": int,
+    "number": int,
+    "float": float,
+    "decimal": float,
+    "bool": bool,
+    "boolean": bool,
+    "date": date,
+    "datetime": datetime,
+}
+
+
+# Common non-ISO formats tried with strptime before falling back to dateutil.
+# Month-first comes first to match dateutil's default for ambiguous dates, so
+# day-first only applies when the first number cannot be a month.
+_FAST_DATE_FORMATS = ("%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d")
+
+
+@lru_cache(maxsize=1024)
+def _parse_datetime_string(value: str) -> datetime:
+    """
+    Parse a date/datetime string, trying the stdlib parsers before dateutil.
+    
+    Memoized because the same date strings tend to recur across fields and
+    documents; datetimes are immutable, so sharing results is safe.
+    """
+    try:
+        # fromisoformat only accepts a trailing 'Z' from Python 3.11
+        return datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+    except ValueError:
+        pass
+    # strptime lets %d match a space-padded day, so leave anything with spaces to dateutil
+    if ' ' not in value:
+        for fmt in _FAST_DATE_FORMATS:
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+    # dateutil is slow to import and only needed for free-form strings
+    from dateutil import parser as date_parser
+    return date_parser.parse(value)
+
+
+def _validate_date(v, field_name: str):
+    """Coerce a value to a date; field_name is only used in error messages."""
+    # Model output arrives as JSON strings, so check for an exact str first
+    # and only walk the isinstance() chain for everything else
+    if type(v) is not str:
+        if v is None or type(v) is date:
             return v
         if isinstance(v, datetime):
             return v.date()
-        if isinstance(v, str):
-            try:
-                parsed = date_parser.parse(v)
-                return parsed.date()
-            except (ValueError, TypeError) as e:
-                raise ValueError(f"Could not parse date '{v}' for field {field_name}: {e}")
-        raise ValueError(f"Invalid date format for field {field_name}: {v}")
-    return validate_date
+        if isinstance(v, date):
+            return v
+        if not isinstance(v, str):
+            raise ValueError(f"Invalid date format for field {field_name}: {v}")
+    try:
+        return _parse_datetime_string(v).date()
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Could not parse date '{v}' for field {field_name}: {e}")
 
 
-@lru_cache(maxsize=32)
-def get_datetime_validator(field_name: str):
-    """Get a cached datetime validator function."""
-    def validate_datetime(v):
+def _validate_datetime(v, field_name: str):
+    """Coerce a value to a datetime; field_name is only used in error messages."""
+    if type(v) is not str:
         if v is None or isinstance(v, datetime):
             return v
         if isinstance(v, date):
             return datetime.combine(v, datetime.min.time())
-        if isinstance(v, str):
-            try:
-                return date_parser.parse(v)
-            except (ValueError, TypeError) as e:
-                raise ValueError(f"Could not parse datetime '{v}' for field {field_name}: {e}")
-        raise ValueError(f"Invalid datetime format for field {field_name}: {v}")
-    return validate_datetime
+        if not isinstance(v, str):
+            raise ValueError(f"Invalid datetime format for field {field_name}: {v}")
+    try:
+        return _parse_datetime_string(v)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Could not parse datetime '{v}' for field {field_name}: {e}")
+
+
+# Module-level cached validators for better performance; every field shares
+# the same validation code and only binds its name for error messages
+@lru_cache(maxsize=32)
+def get_date_validator(field_name: str):
+    """Get a cached date validator function."""
+    return partial(_validate_date, field_name=field_name)
 
 
 @lru_cache(maxsize=32)
+def get_datetime_validator(field_name: str):
+    """Get a cached datetime validator function."""
+    return partial(_validate_datetime, field_name=field_name)
+
+
+def _validate_list_items(v, validate_item, field_name: str):
+    """Apply an item validator to every non-None element of a list value.
+
+    A missing value stays None rather than becoming an empty list, and a lone
+    string is treated as a one-element list.
+    """
+    if v is None:
+        return None
+    if isinstance(v, str):
+        return [validate_item(v, field_name)]
+    return [validate_item(item, field_name) if item is not None else None for item in v]
+
+
+# Field-level validators take the field name from pydantic's ValidationInfo,
+# so every date/datetime field in every schema shares one annotated type
+def _validate_date_field(v, info: ValidationInfo):
+    return _validate_date(v, info.field_name)
+
+
+def _validate_datetime_field(v, info: ValidationInfo):
+    return _validate_datetime(v, info.field_name)
+
+
+def _validate_date_list_field(v, info: ValidationInfo):
+    return _validate_list_items(v, _validate_date, info.field_name)
+
+
+def _validate_datetime_list_field(v, info: ValidationInfo):
+    return _validate_list_items(v, _validate_datetime, info.field_name)
+
+
+_DATE_FIELD_TYPE = Annotated[Optional[date], BeforeValidator(_validate_date_field)]
+_DATETIME_FIELD_TYPE = Annotated[Optional[datetime], BeforeValidator(_validate_datetime_field)]
+_DATE_LIST_FIELD_TYPE = Annotated[Optional[List[date]], BeforeValidator(_validate_date_list_field)]
+_DATETIME_LIST_FIELD_TYPE = Annotated[Optional[List[datetime]], BeforeValidator(_validate_datetime_list_field)]
+
+
+@lru_cache(maxsize=256)
+def get_enum_validator(valid_values: Tuple[str, ...], is_multi_enum: bool):
+    """Get a cached enum validator that maps values outside the enum to None."""
+    # Enum values are strings, so only strings can match; this also keeps
+    # unhashable values away from the set lookup
+    valid_set = frozenset(valid_values)
+    
+    def validate_enum(v):
+        if v is None:
+            return None
+        
+        if is_multi_enum:
+            # Multi-enum: expect a list
+            if not isinstance(v, list):
+                return None  # Invalid format, return None
+            
+            # Skip invalid items, don't add them to result
+            result = [item for item in v if isinstance(item, str) and item in valid_set]
+            return result if result else None
+        else:
+            # Single enum: expect a single value; invalid values become None
+            return v if isinstance(v, str) and v in valid_set else None
+    
+    return validate_enum
+
+
+# TypeAdapters built by get_type_adapter, keyed by schema class; oldest evicted first
+_TYPE_ADAPTER_CACHE_SIZE = 32
+_type_adapter_cache: Dict[Type[BaseModel], TypeAdapter] = {}
+_type_adapter_cache_lock = threading.Lock()
+
+
 def get_type_adapter(schema_class: Type[BaseModel]) -> TypeAdapter:
     """Get a cached TypeAdapter for better performance."""
-    return TypeAdapter(schema_class)
-
-
-def _hash_questions(questions: Dict[str, Dict[str, Any]]) -> str:
-    """Create a hash of questions dictionary for caching."""
-    # Create a consistent string representation for hashing
-    normalized = {}
-    for key, value in questions.items():
-        normalized[key] = {
-            'question': value.get('question', ''),
-            'type': value.get('type', 'str'),
-            'output_name': value.get('output_name', key),
-            'default': value.get('default', None)
-        }
+    # Called for every validated response, so hits skip the lock
+    try:
+        return _type_adapter_cache[schema_class]
+    except KeyError:
+        pass
     
-    questions_str = json.dumps(normalized, sort_keys=True)
-    return hashlib.md5(questions_str.encode()).hexdigest()
+    with _type_adapter_cache_lock:
+        adapter = _type_adapter_cache.get(schema_class)
+        if adapter is None:
+            adapter = TypeAdapter(schema_class)
+            if len(_type_adapter_cache) >= _TYPE_ADAPTER_CACHE_SIZE:
+                del _type_adapter_cache[next(iter(_type_adapter_cache))]
+            _type_adapter_cache[schema_class] = adapter
+    return adapter
 
 
-@lru_cache(maxsize=128)
-def get_cached_schema(questions_hash: str, schema_name: str, questions_json: str) -> Type[BaseModel]:
-    """Get a cached schema or create a new one if not cached."""
-    # Reconstruct questions from JSON for processing
-    questions = json.loads(questions_json)
-    return _create_schema_uncached(questions, schema_name)
+@lru_cache(maxsize=32)
+def get_schema_json(schema_class: Type[BaseModel]) -> str:
+    """Get a cached, key-sorted JSON Schema string for a schema class."""
+    return json.dumps(schema_class.model_json_schema(), sort_keys=True)
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a default value into a hashable form that distinguishes it from any other value."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    # Tag scalars with their type, since e.g. 1, 1.0 and True compare (and hash) equal
+    return type(value), value
+
+
+def _questions_cache_key(questions: Dict[str, Dict[str, Any]]) -> tuple:
+    """Create a hashable cache key from the schema-relevant parts of a questions dictionary."""
+    # Only what affects the generated schema is included, in a consistent (sorted) order
+    return tuple(sorted(
+        (key,
+         value.get('question', ''),
+         value.get('type', 'str'),
+         value.get('output_name', key),
+         _freeze(value.get('default', None)))
+        for key, value in questions.items()
+    ))
+
+
+# Schemas built by get_cached_schema, keyed by (questions key, schema name); oldest evicted first
+_SCHEMA_CACHE_SIZE = 128
+_schema_cache: Dict[tuple, Type[BaseModel]] = {}
+_schema_cache_lock = threading.Lock()
+
+
+def get_cached_schema(questions_key: tuple, schema_name: str,
+                      questions: Dict[str, Dict[str, Any]]) -> Type[BaseModel]:
+    """Get a cached schema or create a new one from the questions if not cached."""
+    cache_key = (questions_key, schema_name)
+    try:
+        return _schema_cache[cache_key]
+    except KeyError:
+        pass
+    
+    with _schema_cache_lock:
+        schema_class = _schema_cache.get(cache_key)
+        if schema_class is None:
+            # Fields are created in sorted order; copy so later edits to the questions can't leak in
+            schema_class = _create_schema_uncached(copy.deepcopy(dict(sorted(questions.items()))), schema_name)
+            if len(_schema_cache) >= _SCHEMA_CACHE_SIZE:
+                del _schema_cache[next(iter(_schema_cache))]
+            _schema_cache[cache_key] = schema_class
+    return schema_class
 
 
 def create_safe_literal_type(enum_values: List[str]):
     """Create a Literal type safely without using eval()."""
-    if len(enum_values) == 1:
-        # For single values, create Literal directly
-        value = enum_values[0]
-        return Literal[value]
-    elif len(enum_values) == 2:
-        return Literal[enum_values[0], enum_values[1]]
-    elif len(enum_values) == 3:
-        return Literal[enum_values[0], enum_values[1], enum_values[2]]
-    elif len(enum_values) == 4:
-        return Literal[enum_values[0], enum_values[1], enum_values[2], enum_values[3]]
-    elif len(enum_values) == 5:
-        return Literal[enum_values[0], enum_values[1], enum_values[2], enum_values[3], enum_values[4]]
-    else:
-        # For more than 5 values, use tuple unpacking
-        # This is safer than eval but has a practical limit
-        return Literal[tuple(enum_values)]
+    # Subscripting with a tuple is equivalent to listing the values, for any count
+    return Literal[tuple(enum_values)]
 
 
 def create_date_validator(field_name: str, target_type: type):
@@ -125,7 +281,7 @@ def create_date_validator(field_name: str, target_type: type):
             
         if isinstance(v, str):
             try:
-                parsed = date_parser.parse(v)
+                parsed = _parse_datetime_string(v)
                 return parsed.date() if target_type == date else parsed
             except (ValueError, TypeError) as e:
                 raise ValueError(f"Could not parse {target_type.__name__} '{v}' for field {field_name}: {e}")
@@ -148,12 +304,8 @@ def build_schema_from_questions(questions: Dict[str, Dict[str, Any]],
     Returns:
         Type[BaseModel]: Dynamic Pydantic model class
     """
-    # Create hash for caching
-    questions_hash = _hash_questions(questions)
-    questions_json = json.dumps(questions, sort_keys=True)
-    
     # Try to get cached schema
-    return get_cached_schema(questions_hash, schema_name, questions_json)
+    return get_cached_schema(_questions_cache_key(questions), schema_name, questions)
 
 
 def _create_schema_uncached(questions: Dict[str, Dict[str, Any]], schema_name: str) -> Type[BaseModel]:
@@ -167,107 +319,43 @@ def _create_schema_uncached(questions: Dict[str, Dict[str, Any]], schema_name: s
     Returns:
         Type[BaseModel]: Dynamic Pydantic model class
     """
-    fields = {}
-    
-    for field_name, question_data in questions.items():
-        field_type_str = question_data.get("type", "str")
-        field_description = question_data.get("question", "")
-        output_name = question_data.get("output_name", field_name)
-        default_value = question_data.get("default", None)
-        
-        # Check if this is an array type
-        is_array, base_type_str = _parse_array_type(field_type_str)
-        
-        # Create Field with default value if specified, otherwise use None
-        field_kwargs = {"description": field_description}
-        if default_value is not None:
-            field_kwargs["default"] = default_value
-        else:
-            field_kwargs["default"] = None
-        
-        if base_type_str == "date":
-            # Use cached date validator
-            date_validator = get_date_validator(output_name)
-            if is_array:
-                annotated_type = Annotated[Optional[List[date]], BeforeValidator(lambda v: [date_validator(item) if item is not None else None for item in (v or [])])]
-            else:
-                annotated_type = Annotated[Optional[date], BeforeValidator(date_validator)]
-            fields[output_name] = (annotated_type, Field(**field_kwargs))
-            
-        elif base_type_str == "datetime":
-            # Use cached datetime validator
-            datetime_validator = get_datetime_validator(output_name)
-            if is_array:
-                annotated_type = Annotated[Optional[List[datetime]], BeforeValidator(lambda v: [datetime_validator(item) if item is not None else None for item in (v or [])])]
-            else:
-                annotated_type = Annotated[Optional[datetime], BeforeValidator(datetime_validator)]
-            fields[output_name] = (annotated_type, Field(**field_kwargs))
-            
-        else:
-            field_type = _get_python_type(field_type_str, output_name)
-            # Check if this is an enum type - if so, it's already Optional
-            is_enum, _, _ = _parse_enum_type(field_type_str)
-            if is_enum:
-                # Enum types are already Optional due to the validator
-                fields[output_name] = (field_type, Field(**field_kwargs))
-            else:
-                # Make all non-enum fields Optional
-                fields[output_name] = (Optional[field_type], Field(**field_kwargs))
+    # Create Field with default value if specified, otherwise use None
+    fields = {
+        question_data.get("output_name", field_name): (
+            _get_field_annotation(question_data.get("type", "str")),
+            Field(description=question_data.get("question", ""), default=question_data.get("default", None)),
+        )
+        for field_name, question_data in questions.items()
+    }
     
     # Create the dynamic model
     return create_model(schema_name, **fields)
 
 
-def _parse_array_type(type_str: str) -> Tuple[bool, str]:
-    """
-    Parse array type specification like 'list(str)'.
-    
-    Args:
-        type_str: String representation of the type
-        
-    Returns:
-        Tuple[bool, str]: (is_array, base_type_str)
-    """
-    type_str = type_str.strip().lower()
-    
-    # Check if this is an array type specification
-    if type_str.startswith("list(") and type_str.endswith(")"):
-        # Extract the base type from list(base_type)
-        base_type = type_str[5:-1].strip()
-        return True, base_type
-    
-    return False, type_str
-
-
-def _parse_enum_type(type_str: str) -> Tuple[bool, bool, List[str]]:
-    """
-    Parse enum type specification like 'enum(val1,val2,val3)' or 'multi_enum(val1,val2,val3)'.
-    
-    Args:
-        type_str: String representation of the type
-        
-    Returns:
-        Tuple[bool, bool, List[str]]: (is_enum, is_multi, enum_values)
-    """
-    type_str = type_str.strip()
+@lru_cache(maxsize=256)
+def _get_field_annotation(field_type_str: str) -> Any:
+    """Get the (Optional) annotation used for a schema field of the given type."""
+    is_array, base_type_str = _parse_array_type(field_type_str)
     
-    if type_str.startswith("enum(") and type_str.endswith(")"):
-        enum_values = _extract_enum_values(type_str)
-        return True, False, enum_values
-    elif type_str.startswith("multi_enum(") and type_str.endswith(")"):
-        enum_values = _extract_enum_values(type_str)
-        return True, True, enum_values
+    if base_type_str == "date":
+        return _DATE_LIST_FIELD_TYPE if is_array else _DATE_FIELD_TYPE
+    if base_type_str == "datetime":
+        return _DATETIME_LIST_FIELD_TYPE if is_array else _DATETIME_FIELD_TYPE
     
-    return False, False, []
+    annotated_type = _get_python_type(field_type_str)
+    # Enum types are already Optional due to the validator; make all other fields Optional
+    is_enum, _, _ = _parse_enum_type(field_type_str)
+    return annotated_type if is_enum else Optional[annotated_type]
 
 
+@lru_cache(maxsize=256)
 def _get_python_type(type_str: str, field_name: str = None) -> Type:
     """
     Convert string type to Python type with flexible enum handling.
     
     Args:
         type_str: String representation of the type
-        field_name: Field name for creating custom validators
+        field_name: Field name (unused, kept for backward compatibility)
         
     Returns:
         Type: Corresponding Python type
@@ -276,35 +364,8 @@ def _get_python_type(type_str: str, field_name: str = None) -> Type:
     # Check if this is an enum type first
     is_enum, is_multi, enum_values = _parse_enum_type(type_str)
     if is_enum:
-        # Create a flexible enum validator that handles invalid values
-        def create_enum_validator(valid_values: List[str], is_multi_enum: bool, field_name: str):
-            def validate_enum(v):
-                if v is None:
-                    return None
-                
-                if is_multi_enum:
-                    # Multi-enum: expect a list
-                    if not isinstance(v, list):
-                        return None  # Invalid format, return None
-                    
-                    result = []
-                    for item in v:
-                        if item in valid_values:
-                            result.append(item)
-                        # Skip invalid items, don't add them to result
-                    return result if result else None
-                else:
-                    # Single enum: expect a single value
-                    if v in valid_values:
-                        return v
-                    else:
-                        # Invalid enum value, return None
-                        return None
-            
-            return validate_enum
-        
-        # Create the validator
-        enum_validator = create_enum_validator(enum_values, is_multi, field_name or "unknown")
+        # Validators are shared by every field with the same enum values
+        enum_validator = get_enum_validator(tuple(enum_values), is_multi)
         
         # Use the safe literal type creation function
         literal_type = create_safe_literal_type(enum_values)
@@ -320,22 +381,7 @@ def _get_python_type(type_str: str, field_name: str = None) -> Type:
     is_array, base_type_str = _parse_array_type(type_str)
     
     # Get the base type
-    type_mapping = {
-        "str": str,
-        "string": str,
-        "text": str,
-        "int": int,
-        "integer": int,
-        "number": int,
-        "float": float,
-        "decimal": float,
-        "bool": bool,
-        "boolean": bool,
-        "date": date,
-        "datetime": datetime,
-    }
-    
-    base_type = type_mapping.get(base_type_str.lower(), str)
+    base_type = _TYPE_MAPPING.get(base_type_str.lower(), str)
     
     # Return List[base_type] for array types
     if is_array:
@@ -344,47 +390,15 @@ def _get_python_type(type_str: str, field_name: str = None) -> Type:
     return base_type
 
 
-def create_extraction_prompt(questions: Dict[str, Dict[str, Any]], 
-                           document_text: str,
-                           schema_class: Type[BaseModel]) -> str:
-    """
-    Create a prompt for extracting structured data from document text.
-    
-    Args:
-        questions: Dictionary of questions
-        document_text: Text content of the document
-        schema_class: Pydantic model class for structured output
-        
-    Returns:
-        str: Formatted prompt for the LLM
-    """
-    # Build questions list
-    questions_list = []
-    for field_name, question_data in questions.items():
-        output_name = question_data.get("output_name", field_name)
-        question_text = question_data.get("question", "")
-        data_type = question_data.get("type", "str")
-        
-        # Check if this is an enum type and provide enhanced instructions
-        is_enum, is_multi, enum_values = _parse_enum_type(data_type)
-        if is_enum:
-            values_str = ", ".join(enum_values)
-            if is_multi:
-                instruction = f"Select all that apply from: [{values_str}]"
-                questions_list.append(f"- {output_name}: {question_text}\n  {instruction}")
-            else:
-                instruction = f"Choose one from: [{values_str}]"
-                questions_list.append(f"- {output_name}: {question_text}\n  {instruction}")
-        else:
-            # Use current format for non-enum types
-            questions_list.append(f"- {output_name} ({data_type}): {question_text}")
-    
-    questions_str = "\n".join(questions_list)
-    
-    prompt = f"""Please analyze the following document and extract the requested information.
+# Extraction prompt, split around the document text so the (possibly large)
+# document is concatenated once rather than run through str.format
+_PROMPT_PREFIX = """Please analyze the following document and extract the requested information.
 
 Document text:
-{document_text}
+"""
+
+# Filled in with str.format (literal braces are doubled)
+_PROMPT_SUFFIX_TEMPLATE = """
 
 Please answer the following questions based on the document content:
 {questions_str}
@@ -400,18 +414,83 @@ Example response format:
     "field_name_3": null
 }}
 """
+
+
+def format_questions_block(questions: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Format the list of questions shown in the extraction prompt.
+    
+    The block only depends on the questions, so callers processing many
+    documents can build it once and pass it to create_extraction_prompt.
+    
+    Args:
+        questions: Dictionary of questions
+        
+    Returns:
+        str: One entry per question, separated by newlines
+    """
+    return "\n".join(_format_question_line(field_name, question_data)
+                     for field_name, question_data in questions.items())
+
+
+def _format_question_line(field_name: str, question_data: Dict[str, Any]) -> str:
+    """Format a single question entry of the extraction prompt."""
+    output_name = question_data.get("output_name", field_name)
+    question_text = question_data.get("question", "")
+    data_type = question_data.get("type", "str")
+    
+    # Check if this is an enum type and provide enhanced instructions
+    is_enum, is_multi, enum_values = _parse_enum_type(data_type)
+    if is_enum:
+        values_str = ", ".join(enum_values)
+        if is_multi:
+            instruction = f"Select all that apply from: [{values_str}]"
+        else:
+            instruction = f"Choose one from: [{values_str}]"
+        return f"- {output_name}: {question_text}\n  {instruction}"
+    
+    # Use current format for non-enum types
+    return f"- {output_name} ({data_type}): {question_text}"
+
+
+def create_extraction_prompt(questions: Dict[str, Dict[str, Any]], 
+                           document_text: str,
+                           schema_class: Type[BaseModel],
+                           questions_block: Optional[str] = None) -> str:
+    """
+    Create a prompt for extracting structured data from document text.
     
-    return prompt
+    Args:
+        questions: Dictionary of questions
+        document_text: Text content of the document
+        schema_class: Pydantic model class for structured output
+        questions_block: Precomputed format_questions_block(questions), if available
+        
+    Returns:
+        str: Formatted prompt for the LLM
+    """
+    questions_str = questions_block if questions_block is not None else format_questions_block(questions)
+    
+    return _PROMPT_PREFIX + document_text + _prompt_suffix(questions_str)
+
+
+@lru_cache(maxsize=32)
+def _prompt_suffix(questions_str: str) -> str:
+    """Get the part of the extraction prompt that follows the document text."""
+    return _PROMPT_SUFFIX_TEMPLATE.format(questions_str=questions_str)
 
 
 def validate_extraction_result(result: Dict[str, Any], 
-                             schema_class: Type[BaseModel]) -> BaseModel:
+                             schema_class: Type[BaseModel],
+                             trusted: bool = False) -> BaseModel:
     """
     Validate and parse extraction result using the schema.
     
     Args:
         result: Raw extraction result dictionary
         schema_class: Pydantic model class for validation
+        trusted: If True, the result already holds validated values (for example
+            a model_dump() of the same schema) and is wrapped without validation
         
     Returns:
         BaseModel: Validated model instance
@@ -420,7 +499,7 @@ def validate_extraction_result(result: Dict[str, Any],
         ValueError: If validation fails
     """
     # Check if result is the expected type
-    if not isinstance(result, dict):
+    if type(result) is not dict and not isinstance(result, dict):
         result_type = type(result).__name__
         raise ValueError(
             f"Expected dictionary for extraction result, got {result_type}. "
@@ -428,24 +507,32 @@ def validate_extraction_result(result: Dict[str, Any],
             f"Result: {result}"
         )
     
+    if trusted:
+        return schema_class.model_construct(**result)
+    
     try:
-        return schema_class(**result)
+        # Validate the dict directly rather than unpacking it into keyword arguments
+        return get_type_adapter(schema_class).validate_python(result)
     except Exception as e:
         raise ValueError(f"Failed to validate extraction result: {e}")
 
 
-def schema_to_dict(schema_instance: BaseModel, schema_class: Type[BaseModel] = None) -> Dict[str, Any]:
+def schema_to_dict(schema_instance: BaseModel, schema_class: Type[BaseModel] = None,
+                   mode: str = 'python') -> Dict[str, Any]:
     """
     Convert schema instance to dictionary.
     
     Args:
         schema_instance: Validated Pydantic model instance
         schema_class: Optional schema class (unused, kept for backward compatibility)
+        mode: 'python' for Python objects, or 'json' for JSON-compatible values
+            (e.g. ISO strings for dates) when the result will be serialized
         
     Returns:
         Dict[str, Any]: Dictionary representation
     """
-    return schema_instance.model_dump()
+    # Instances come from validation against their own schema, so serialization warnings are skipped
+    return schema_instance.model_dump(mode=mode, warnings=False)
 
 
 def get_schema_fields(schema_class: Type[BaseModel]) -> Dict[str, str]:
@@ -458,13 +545,17 @@ def get_schema_fields(schema_class: Type[BaseModel]) -> Dict[str, str]:
     Returns:
         Dict[str, str]: Mapping of field names to type names
     """
-    fields = {}
+    return dict(_get_schema_field_types(schema_class))
+
+
+@lru_cache(maxsize=32)
+def _get_schema_field_types(schema_class: Type[BaseModel]) -> Tuple[Tuple[str, str], ...]:
+    """Get cached (field name, type name) pairs for a schema class."""
+    fields = []
     for field_name, field_info in schema_class.model_fields.items():
         field_type = field_info.annotation
-        if hasattr(field_type, '__name__'):
-            type_name = field_type.__name__
-        else:
-            type_name = str(field_type)
-        fields[field_name] = type_name
+        # Plain classes have a __name__; typing constructs fall back to their repr
+        type_name = getattr(field_type, '__name__', None)
+        fields.append((field_name, type_name if type_name is not None else str(field_type)))
     
-    return fields
+    return tuple(fields)
@@ -37,6 +37,24 @@ def test_date_field_parsing():
         assert result.pub_date == expected_date, f"Failed to parse: {test_data['pub_date']}"
 
 
+def test_slash_date_order_matches_dateutil():
+    """Test that slash-separated dates are month-first unless the first number cannot be a month."""
+    
+    questions = {
+        "pub_date": {
+            "question": "What is the publication date?",
+            "type": "date",
+            "output_name": "pub_date"
+        }
+    }
+    
+    schema_class = build_schema_from_questions(questions)
+    
+    assert validate_extraction_result({"pub_date": "03/04/2015"}, schema_class).pub_date == date(2015, 3, 4)
+    assert validate_extraction_result({"pub_date": "20/10/2015"}, schema_class).pub_date == date(2015, 10, 20)
+    assert validate_extraction_result({"pub_date": " 1/12/2015"}, schema_class).pub_date == date(2015, 1, 12)
+
+
 def test_datetime_field_parsing():
     """Test that datetime fields can parse various datetime formats."""
     
@@ -302,3 +320,23 @@ def test_backward_compatibility():
     assert result.title == "Test Document"
     assert result.page_count == 100
     assert result.is_published is True
+
+
+def test_trusted_result_skips_validation():
+    """Test that trusted results are wrapped without re-parsing their values."""
+    
+    questions = {
+        "pub_date": {
+            "question": "What is the publication date?",
+            "type": "date",
+            "output_name": "pub_date"
+        }
+    }
+    
+    schema_class = build_schema_from_questions(questions)
+    validated = validate_extraction_result({"pub_date": "October 20, 2015"}, schema_class)
+    
+    result = validate_extraction_result(validated.model_dump(), schema_class, trusted=True)
+    
+    assert isinstance(result, schema_class)
+    assert result.pub_date == date(2015, 10, 20)
@@ -314,6 +314,136 @@ class TestInquiryAPIHandling:
             inquiry.process_document(sample_document)
 
 
+    def test_available_model_resolved_once(self, mock_openai_client, test_config, monkeypatch):
+        """Test that the model list is queried only once when no model is configured."""
+        test_config.model = ""
+        monkeypatch.setattr(Inquiry, "_model_cache", {})
+        inquiry = Inquiry(
+            questions={"default": {"question": "Who is the author?", "type": "str"}},
+            client=mock_openai_client,
+            config=test_config
+        )
+        
+        inquiry.process_text("First document.")
+        inquiry.process_text("Second document.")
+        
+        assert mock_openai_client.models.list.call_count == 1
+        create_kwargs = mock_openai_client.chat.completions.create.call_args.kwargs
+        assert create_kwargs["model"] == "gpt-3.5-turbo"
+    
+    def test_available_model_shared_across_instances(self, mock_openai_client, test_config, monkeypatch):
+        """Test that a discovered model is reused by instances using the same endpoint."""
+        test_config.model = ""
+        monkeypatch.setattr(Inquiry, "_model_cache", {})
+        mock_openai_client.base_url = "http://model-cache-test/api/v1"
+        mock_openai_client.api_key = "model-cache-key"
+        questions = {"default": {"question": "Who is the author?", "type": "str"}}
+        
+        for _ in range(2):
+            inquiry = Inquiry(questions=questions, client=mock_openai_client, config=test_config)
+            inquiry.process_text("Some document.")
+        
+        assert mock_openai_client.models.list.call_count == 1
+        # The raw API key is never used as part of the cache key
+        assert all("model-cache-key" not in key for key in Inquiry._model_cache)
+
+
+    def test_tool_calling_used_when_enabled(self, mock_openai_client, test_config):
+        """Test that extraction uses a forced function call when tool calling is enabled."""
+        test_config.use_tool_calling = True
+        tool_call = MagicMock()
+        tool_call.function.arguments = '{"author": "Test Author"}'
+        mock_openai_client.chat.completions.create.return_value.choices[0].message.tool_calls = [tool_call]
+        
+        inquiry = Inquiry(
+            questions={"author": {"question": "Who is the author?", "type": "str"}},
+            client=mock_openai_client,
+            config=test_config
+        )
+        result = inquiry.process_text("Written by Test Author.")
+        
+        assert result == {"author": "Test Author"}
+        create_kwargs = mock_openai_client.chat.completions.create.call_args.kwargs
+        assert create_kwargs["tools"][0]["function"]["name"] == "extract"
+        mock_openai_client.beta.chat.completions.parse.assert_not_called()
+    
+    @pytest.mark.parametrize("error_class,status_code,still_supported", [
+        ("InternalServerError", 500, True),
+        ("BadRequestError", 400, False),
+    ])
+    def test_tool_calling_disabled_only_when_rejected(self, mock_openai_client, test_config,
+                                                      error_class, status_code, still_supported):
+        """Test that server errors keep tool calling enabled while rejections disable it."""
+        import openai
+        
+        test_config.use_tool_calling = True
+        response = MagicMock(status_code=status_code)
+        json_response = MagicMock()
+        json_response.choices[0].message.content = '{"author": "Test Author"}'
+        
+        def create(**kwargs):
+            if "tools" in kwargs:
+                raise getattr(openai, error_class)("tool call failed", response=response, body=None)
+            return json_response
+        
+        mock_openai_client.chat.completions.create.side_effect = create
+        inquiry = Inquiry(
+            questions={"author": {"question": "Who is the author?", "type": "str"}},
+            client=mock_openai_client,
+            config=test_config
+        )
+        
+        assert inquiry.process_text("Written by Test Author.") == {"author": "Test Author"}
+        assert inquiry._tool_calling_supported is still_supported
+
+
+class TestInquiryResponseCache:
+    """Test suite for the on-disk API response cache."""
+    
+    def test_cached_response_skips_api_call(self, mock_openai_client, test_config):
+        """Test that a repeated request is served from the cache directory."""
+        pytest.importorskip("diskcache")
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            test_config.cache_dir = cache_dir
+            questions = {"author": {"question": "Who is the author?", "type": "str"}}
+            mock_openai_client.chat.completions.create.return_value.choices[0].message.content = '{"author": "Test Author"}'
+            
+            inquiry = Inquiry(questions=questions, client=mock_openai_client, config=test_config)
+            first = inquiry.process_text("Written by Test Author.")
+            calls_after_first = mock_openai_client.chat.completions.create.call_count
+            
+            # A new instance sharing the directory should reuse the stored response
+            inquiry = Inquiry(questions=questions, client=mock_openai_client, config=test_config)
+            second = inquiry.process_text("Written by Test Author.")
+            
+            assert first == second == {"author": "Test Author"}
+            assert mock_openai_client.chat.completions.create.call_count == calls_after_first
+            inquiry._response_cache.close()
+    
+    def test_cache_disabled_by_default(self, mock_openai_client, test_config):
+        """Test that no response cache is opened without a cache directory."""
+        inquiry = Inquiry(questions="Who is the author?", client=mock_openai_client, config=test_config)
+        assert inquiry._response_cache is None
+        assert inquiry._memory_cache is None
+    
+    def test_memory_cache_skips_repeat_api_call(self, mock_openai_client, test_config):
+        """Test that a repeated request is served from the in-memory cache until cleared."""
+        test_config.cache_size = 2
+        mock_openai_client.chat.completions.create.return_value.choices[0].message.content = '{"author": "Test Author"}'
+        inquiry = Inquiry(questions={"author": {"question": "Who is the author?", "type": "str"}},
+                          client=mock_openai_client, config=test_config)
+        
+        first = inquiry.process_text("Written by Test Author.")
+        calls_after_first = mock_openai_client.chat.completions.create.call_count
+        assert inquiry.process_text("Written by Test Author.") == first
+        assert mock_openai_client.chat.completions.create.call_count == calls_after_first
+        
+        inquiry.cache_clear()
+        inquiry.process_text("Written by Test Author.")
+        assert mock_openai_client.chat.completions.create.call_count > calls_after_first
+
+
 class TestInquiryFromFile:
     """Test suite for creating Inquiry from file."""
     
@@ -376,6 +506,7 @@ class TestInquiryQuestionNormalization:
         assert "default" in normalized
         assert normalized["default"]["question"] == "Who is the author?"
         assert normalized["default"]["type"] == "str"
+        assert normalized["default"]["output_name"] == "default"
     
     def test_normalize_list_questions(self, mock_openai_client, test_config):
         """Test normalizing list of questions."""
@@ -5,11 +5,17 @@ Pytest test suite for metaminer functionality.
 
 import os
 import pytest
+from datetime import date
 from unittest.mock import patch, MagicMock
 from metaminer import Inquiry
-from metaminer.question_parser import parse_questions_from_file
+from metaminer.question_parser import (
+    parse_questions_from_file, parse_questions_as_columns, parse_question_records,
+    validate_question_columns, validate_questions
+)
 from metaminer.document_reader import extract_text
-from metaminer.schema_builder import build_schema_from_questions, create_extraction_prompt
+from metaminer.schema_builder import (
+    build_schema_from_questions, create_extraction_prompt, format_questions_block, get_schema_fields, schema_to_dict
+)
 
 
 @pytest.fixture
@@ -80,6 +86,126 @@ class TestQuestionParsing:
                 assert isinstance(value['type'], str)
                 assert len(value['question']) > 0
     
+    def test_parse_questions_csv_explicit_delimiter(self, tmp_path):
+        """Test CSV parsing with an explicitly provided delimiter."""
+        csv_file = tmp_path / "questions.csv"
+        csv_file.write_text("question;field_name;data_type\nWho is the author?;author;str\n")
+        
+        questions = parse_questions_from_file(str(csv_file), delimiter=";")
+        assert questions["author"]["question"] == "Who is the author?"
+    
+    def test_parse_questions_csv_delimiter_from_header(self, tmp_path):
+        """Test that the header line decides the delimiter when data rows contain other candidates."""
+        csv_file = tmp_path / "questions.csv"
+        csv_file.write_text("question;field_name\nWho, if anyone, signed it?;signer\n")
+        
+        questions = parse_questions_from_file(str(csv_file))
+        assert questions["signer"]["question"] == "Who, if anyone, signed it?"
+    
+    def test_parse_questions_csv_quoted_after_space(self, tmp_path):
+        """Test that quoted cells following a delimiter and a space are unquoted."""
+        csv_file = tmp_path / "questions.csv"
+        csv_file.write_text('question, field_name, data_type\n"Who, exactly, wrote it?", author, "enum(a, b)"\n')
+        
+        questions = parse_questions_from_file(str(csv_file))
+        assert questions["author"]["question"] == "Who, exactly, wrote it?"
+        assert questions["author"]["type"] == "enum(a, b)"
+    
+    def test_parse_questions_csv_undetectable_delimiter(self, tmp_path):
+        """Test that a CSV whose delimiter cannot be detected is read as comma-separated."""
+        csv_file = tmp_path / "questions.csv"
+        csv_file.write_text("question\nWho is the author?\n")
+        
+        questions = parse_questions_from_file(str(csv_file))
+        assert questions["question_1"]["question"] == "Who is the author?"
+    
+    def test_parse_questions_reparses_modified_file(self, tmp_path):
+        """Test that cached parses are independent copies and follow file changes."""
+        txt_file = tmp_path / "questions.txt"
+        txt_file.write_text("Who is the author?\n")
+        
+        first = parse_questions_from_file(str(txt_file))
+        first["question_1"]["type"] = "int"
+        assert parse_questions_from_file(str(txt_file))["question_1"]["type"] == "str"
+        
+        txt_file.write_text("What is the title?\nWho is the author?\n")
+        assert len(parse_questions_from_file(str(txt_file))) == 2
+    
+    def test_parse_questions_txt_cr_line_endings(self, tmp_path):
+        """Test that bare carriage returns separate questions like newlines do."""
+        txt_file = tmp_path / "questions.txt"
+        txt_file.write_bytes(b"Q one?\rQ two?\r")
+        
+        questions = parse_questions_from_file(str(txt_file))
+        assert [q["question"] for q in questions.values()] == ["Q one?", "Q two?"]
+    
+    def test_parse_questions_return_explicit(self, tmp_path):
+        """Test that explicitly typed fields are reported separately from the questions."""
+        csv_file = tmp_path / "questions.csv"
+        csv_file.write_text("question,field_name,data_type\nHow many pages?,pages,int\nWho wrote it?,author,\n")
+        
+        questions, explicit = parse_questions_from_file(str(csv_file), return_explicit=True)
+        
+        assert explicit == {"pages"}
+        assert all("_type_explicit" not in q for q in questions.values())
+    
+    def test_parse_questions_as_columns(self):
+        """Test column-oriented parsing matches the dictionary format."""
+        questions, types, names = parse_questions_as_columns('tests/example_questions.csv')
+        parsed = parse_questions_from_file('tests/example_questions.csv')
+        
+        assert questions == [q['question'] for q in parsed.values()]
+        assert types == [q['type'] for q in parsed.values()]
+        assert names == list(parsed)
+    
+    def test_validate_question_columns(self):
+        """Test column validation reports every empty question."""
+        assert validate_question_columns(*parse_questions_as_columns('tests/example_questions.csv'))
+        
+        with pytest.raises(ValueError, match="Empty question text for a, c"):
+            validate_question_columns([" ", "B?", ""], ["str"] * 3, ["a", "b", "c"])
+        
+        with pytest.raises(ValueError, match="same length"):
+            validate_question_columns(["A?"], [], ["a"])
+    
+    def test_validate_questions_rejects_invalid_entries(self):
+        """Test that non-dictionary and read-only question entries raise ValueError."""
+        from types import MappingProxyType
+        
+        with pytest.raises(ValueError, match="Invalid question data for a"):
+            validate_questions({"a": "What?"})
+        with pytest.raises(ValueError, match="Invalid question data for a"):
+            validate_questions({"a": MappingProxyType({"question": "What?"})})
+        with pytest.raises(ValueError, match="Missing 'question' field for a"):
+            validate_questions({"a": {"type": "str"}})
+    
+    def test_parse_question_records(self):
+        """Test that Question records round-trip to the dictionary format."""
+        csv_file = 'tests/example_questions_with_defaults.csv'
+        records = parse_question_records(csv_file)
+        parsed = parse_questions_from_file(csv_file)
+        
+        assert [r.output_name for r in records] == list(parsed)
+        assert [r.as_dict() for r in records] == list(parsed.values())
+    
+    @pytest.mark.parametrize("csv_file", [
+        'tests/example_questions.csv',
+        'tests/example_questions_with_defaults.csv',
+        'tests/example_questions_with_enums.csv',
+    ])
+    def test_parse_questions_large_csv_path_matches(self, csv_file, monkeypatch):
+        """Test that the pandas path for large CSV files gives the same questions."""
+        from metaminer import question_parser
+        
+        expected = parse_questions_from_file(csv_file)
+        
+        monkeypatch.setattr(question_parser, "_PANDAS_CSV_MIN_SIZE", 0)
+        question_parser._parse_questions_cached.cache_clear()
+        try:
+            assert parse_questions_from_file(csv_file) == expected
+        finally:
+            question_parser._parse_questions_cached.cache_clear()
+    
     def test_parse_questions_file_not_found(self):
         """Test error handling when question file doesn't exist."""
         with pytest.raises(FileNotFoundError):
@@ -141,6 +267,42 @@ class TestSchemaBuilding:
             assert field_name in fields
             assert hasattr(fields[field_name], 'annotation')
     
+    def test_get_schema_fields_returns_independent_copies(self, sample_questions_csv):
+        """Test that cached schema field types are not shared between callers."""
+        schema = build_schema_from_questions(sample_questions_csv)
+        
+        fields = get_schema_fields(schema)
+        assert list(fields) == list(schema.model_fields)
+        
+        fields.clear()
+        assert len(get_schema_fields(schema)) == len(sample_questions_csv)
+    
+    def test_schema_to_dict_json_mode(self):
+        """Test that schema_to_dict can produce JSON-compatible values."""
+        schema = build_schema_from_questions({"published": {"question": "When?", "type": "date"}})
+        instance = schema(published="2024-03-01")
+        
+        assert schema_to_dict(instance) == {"published": date(2024, 3, 1)}
+        assert schema_to_dict(instance, mode='json') == {"published": "2024-03-01"}
+    
+    @pytest.mark.parametrize("value", ["2024-03-01", "2024-03-01T09:30:00Z", "March 1, 2024"])
+    def test_date_field_parses_iso_and_free_form_strings(self, value):
+        """Test that date fields accept ISO 8601 and free-form date strings."""
+        schema = build_schema_from_questions({"published": {"question": "When?", "type": "date"}})
+        assert schema(published=value).published == date(2024, 3, 1)
+
+    def test_date_list_field_none_and_single_string(self):
+        """Test that list(date) fields keep None and wrap a lone string."""
+        schema = build_schema_from_questions({"dates": {"question": "When?", "type": "list(date)"}})
+
+        assert schema(dates=None).dates is None
+        assert schema(dates="2024-03-01").dates == [date(2024, 3, 1)]
+
+    def test_schema_is_cached_for_identical_questions(self, sample_questions_csv):
+        """Test that building the same questions twice reuses the cached schema class."""
+        schema = build_schema_from_questions(sample_questions_csv)
+        assert build_schema_from_questions(dict(sample_questions_csv)) is schema
+
     def test_empty_questions_schema(self):
         """Test schema building with empty questions."""
         schema = build_schema_from_questions({})
@@ -165,6 +327,14 @@ class TestPromptGeneration:
         assert 'author' in prompt.lower()
         assert sample_document_text in prompt
     
+    def test_create_extraction_prompt_with_precomputed_block(self, sample_questions_csv, sample_document_text):
+        """Test that a precomputed questions block gives the same prompt."""
+        schema = build_schema_from_questions(sample_questions_csv)
+        block = format_questions_block(sample_questions_csv)
+        
+        assert create_extraction_prompt(sample_questions_csv, sample_document_text, schema, block) == \
+            create_extraction_prompt(sample_questions_csv, sample_document_text, schema)
+    
     @patch.dict(os.environ, {'OPENAI_API_KEY': 'dummy'})
     def test_prompt_with_real_files(self):
         """Test prompt generation with actual example files."""
@@ -236,7 +406,7 @@ class TestEndToEndFunctionality:
         from metaminer import Inquiry
         from metaminer.question_parser import parse_questions_from_file
         from metaminer.document_reader import extract_text
-        from metaminer.schema_builder import build_schema_from_questions, create_extraction_prompt
+        from metaminer.schema_builder import build_schema_from_questions, create_extraction_prompt, get_schema_fields, schema_to_dict
         
         # Test basic functionality without external dependencies
         questions = {